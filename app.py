@@ -1,23 +1,32 @@
+import os
+
+# Limit native thread pools to one thread per worker so multiple gunicorn
+# workers don't oversubscribe the CPU cores. Must be set before importing numpy/TF.
+for _thread_var in ('TF_NUM_INTRAOP_THREADS', 'TF_NUM_INTEROP_THREADS',
+                    'OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_thread_var, '1')
+
 # Set Matplotlib to use the Agg backend (non-GUI)
 import matplotlib
 matplotlib.use('Agg')  # Must be called before importing pyplot
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_from_directory, url_for
 from flask_cors import CORS
 from envpredictor import HighAccuracyEnvironmentalPredictor
 import traceback
 from datetime import datetime
 import numpy as np
-import pandas as pd
-import geopandas as gpd
 from pykrige.ok import OrdinaryKriging
 import matplotlib.pyplot as plt
 import contextily as ctx
-from shapely.geometry import Point
 import warnings
+import hashlib
 import io
-import base64
-import os
+import tempfile
+import threading
+import uuid
+import zlib
+from functools import lru_cache
 
 warnings.filterwarnings("ignore")
 
@@ -28,56 +37,266 @@ CORS(app)  # Enable CORS for all routes
 # Model path
 MODEL_PATH = "C:/Users/Ashaf/Desktop/Project/Ideathon/Statelite-Website/merra2_advanced_model.keras"
 
-# Initialize predictor with the new model path
+# Initialize predictor at import time. gunicorn imports the app in each worker (no
+# --preload), so every worker loads its own model: TensorFlow's runtime and thread pools
+# don't survive a fork, so the model must not be loaded in the master.
 try:
     if not os.path.exists(MODEL_PATH):
         raise FileNotFoundError(f"Model file not found at {MODEL_PATH}")
-    predictor = HighAccuracyEnvironmentalPredictor(MODEL_PATH)
+    predictor = HighAccuracyEnvironmentalPredictor(
+        MODEL_PATH,
+        quantize=os.environ.get('QUANTIZE_MODEL', '0') == '1',  # INT8 TFLite inference
+        validate=True  # test inference also compiles the model before the first request
+    )
     print("Successfully loaded HighAccuracyEnvironmentalPredictor")
 except Exception as e:
     print(f"Failed to load HighAccuracyEnvironmentalPredictor: {str(e)}")
     print(traceback.format_exc())
     predictor = None  # Set to None if loading fails
 
-# Define API endpoint for predictions
-@app.route('/predict', methods=['POST'])
-def predict():
-    print("Received request for /predict")
-    
-    if predictor is None:
-        error_msg = "HighAccuracyEnvironmentalPredictor failed to initialize. Check server logs for details."
-        print(error_msg)
-        return jsonify({'error': error_msg}), 500
+# Minutes per time bucket used to key cached predictions
+CACHE_TIME_BUCKET_MINUTES = 10
+
+def _time_bucket(current_time):
+    """Round a datetime down to its cache time bucket, formatted as HH:MM."""
+    minute = (current_time.minute // CACHE_TIME_BUCKET_MINUTES) * CACHE_TIME_BUCKET_MINUTES
+    return current_time.replace(minute=minute).strftime("%H:%M")
+
+# Bound the number of concurrent model calls per worker so threads don't
+# oversubscribe the CPU/GPU; cache hits and heatmap rendering are not gated
+MODEL_SLOTS = int(os.environ.get('MODEL_SLOTS', '2'))
+_model_slots = threading.BoundedSemaphore(MODEL_SLOTS)
+
+class _PredictionFailed(Exception):
+    """Carries a predictor error result out of a memoized call, so lru_cache doesn't store it."""
+
+    def __init__(self, result):
+        super().__init__(result['error'])
+        self.result = result
+
+@lru_cache(maxsize=4096)
+def _memoized_predict(date, time_bucket, lat_q, lon_q):
+    """Single-point prediction memoized on (date, time bucket, rounded lat/lon)."""
+    with _model_slots:
+        result = predictor.predict(date_str=date, lat=lat_q, lon=lon_q, time_str=time_bucket)
+    if 'error' in result:
+        raise _PredictionFailed(result)
+    return result
+
+@lru_cache(maxsize=256)
+def _memoized_predict_batch(date, time_bucket, lats_q, lons_q):
+    """Batched prediction memoized on (date, time bucket, rounded lat/lon tuples)."""
+    with _model_slots:
+        result = predictor.predict_batch(
+            date_str=date,
+            lats=np.array(lats_q),
+            lons=np.array(lons_q),
+            time_str=time_bucket
+        )
+    if 'error' in result:
+        raise _PredictionFailed(result)
+    return result
 
-    # Get current date and time in the required format
-    current_time = datetime.now()
-    date = current_time.strftime("%Y%m%d")  # Format: YYYYMMDD (e.g., 20250514)
-    time = current_time.strftime("%H:%M")   # Format: HH:MM (e.g., 16:28)
+def _cached_predict(date, time_bucket, lat_q, lon_q):
+    """Memoized single-point prediction; error results are returned but never cached."""
+    _cache_generation()
+    try:
+        return _memoized_predict(date, time_bucket, lat_q, lon_q)
+    except _PredictionFailed as e:
+        return e.result
 
-    # Get latitude and longitude from the request
-    data = request.json
-    if not data:
-        error_msg = "No JSON data provided in the request."
-        print(f"Validation error: {error_msg}")
-        return jsonify({'error': error_msg}), 400
+def _cached_predict_batch(date, time_bucket, lats_q, lons_q):
+    """Memoized batched prediction; error results are returned but never cached."""
+    _cache_generation()
+    try:
+        return _memoized_predict_batch(date, time_bucket, lats_q, lons_q)
+    except _PredictionFailed as e:
+        return e.result
+
+# Number of nearest sample points used by each local (moving-window) Kriging solve
+N_CLOSEST = int(os.environ.get('N_CLOSEST', '12'))
+
+# Maximum number of sample points used to fit the variogram
+VARIOGRAM_SAMPLE_SIZE = 200
+
+# Heatmap interpolation grid spacing in degrees
+GRID_RES = 0.0045
+
+# Colormap shared by the rendered heatmap and the raw /heatmap-data-json payload
+HEATMAP_CMAP = 'RdYlGn_r'
+
+# Cache basemap tiles on disk so repeated heatmaps don't refetch them over the network
+CTX_CACHE_DIR = os.environ.get('CTX_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'contextily'))
+os.makedirs(CTX_CACHE_DIR, exist_ok=True)
+ctx.set_cache_dir(CTX_CACHE_DIR)
+
+# One heatmap figure per worker process, reused across requests instead of
+# reallocating the Agg canvas each time; the lock serializes access to it
+_FIG_LOCK = threading.Lock()
+_FIG, (_AX, _CAX) = plt.subplots(1, 2, figsize=(12, 8), gridspec_kw={'width_ratios': [20, 1]})
+
+# Rendered heatmaps are written to local disk, shared by every worker on the host,
+# and served from GET /heatmap-image/<token> for HEATMAP_IMAGE_TTL seconds
+HEATMAP_IMAGE_DIR = os.environ.get('HEATMAP_IMAGE_DIR', os.path.join(tempfile.gettempdir(), 'heatmap-images'))
+HEATMAP_IMAGE_TTL = 600  # seconds
+os.makedirs(HEATMAP_IMAGE_DIR, exist_ok=True)
+
+# /cache-clear writes a new generation to this file. Every worker on the host reads it,
+# clears its own prediction caches when it changed, and keys flat heatmaps on it.
+_CACHE_GENERATION_PATH = os.path.join(HEATMAP_IMAGE_DIR, 'cache-generation')
+_seen_cache_generation = None
+
+def _cache_generation():
+    """The shared cache generation; clears this worker's prediction caches when it has changed."""
+    global _seen_cache_generation
+    try:
+        with open(_CACHE_GENERATION_PATH) as f:
+            generation = f.read()
+    except FileNotFoundError:
+        generation = ''
+    if generation != _seen_cache_generation:
+        _memoized_predict.cache_clear()
+        _memoized_predict_batch.cache_clear()
+        _seen_cache_generation = generation
+    return generation
+
+@lru_cache(maxsize=32)
+def _grid_offsets(radius, grid_res):
+    """1-D grid offsets spanning [-radius, radius), shared by every request with the same radius."""
+    offsets = np.arange(-radius, radius, grid_res)
+    offsets.flags.writeable = False
+    return offsets
+
+def _krige_heatmap(samples, latitude, longitude, radius, pollutant='PM2_5'):
+    """Krige the sampled pollutant values onto the grid around the clicked location."""
+    # Grid setup: the sampling window around the clicked location
+    grid_offsets = _grid_offsets(radius, GRID_RES)
+    grid_lon = longitude + grid_offsets
+    grid_lat = latitude + grid_offsets
+
+    # Fit the variogram on a fixed-size subsample when there are many points;
+    # the Kriging system itself still uses every sample
+    variogram_parameters = None
+    n_samples = len(samples['latitude'])
+    if n_samples > VARIOGRAM_SAMPLE_SIZE:
+        sub = np.random.default_rng(0).choice(n_samples, VARIOGRAM_SAMPLE_SIZE, replace=False)
+        variogram_parameters = OrdinaryKriging(
+            samples['longitude'][sub], samples['latitude'][sub], samples[pollutant][sub],
+            variogram_model='spherical',
+            verbose=False, enable_plotting=False
+        ).variogram_model_parameters
+
+    # Kriging
+    OK = OrdinaryKriging(
+        samples['longitude'], samples['latitude'], samples[pollutant],
+        variogram_model='spherical',
+        variogram_parameters=variogram_parameters,
+        verbose=False, enable_plotting=False
+    )
+    # NaN filtering can leave fewer samples than N_CLOSEST; cKDTree would then return
+    # out-of-range neighbour indices
+    z, ss = OK.execute('grid', grid_lon, grid_lat,
+                       n_closest_points=min(N_CLOSEST, n_samples), backend='C')
+    return grid_lon, grid_lat, z
+
+def _render_heatmap(samples, grid_lon, grid_lat, z, pollutant='PM2_5'):
+    """Render the kriged heatmap and sample points over a basemap as PNG bytes."""
+    # AQI categories for PM2.5 (US EPA style)
+    aqi_bins = [0, 12, 35.4, 55.4, 150.4, 250.4, 500]
+    aqi_labels = ['Good', 'Moderate', 'Unhealthy for Sensitive Groups',
+                  'Unhealthy', 'Very Unhealthy', 'Hazardous']
+    aqi_colors = ['#00e400', '#ffff00', '#ff7e00', '#ff0000', '#8f3f97', '#7e0023']
+
+    with _FIG_LOCK:
+        # Plot
+        _AX.cla()
+        _CAX.cla()
+        im = _AX.pcolormesh(grid_lon, grid_lat, z, shading='auto',
+                            cmap=HEATMAP_CMAP, vmin=0, vmax=100, alpha=0.8)
 
-    latitude = data.get('latitude')
-    longitude = data.get('longitude')
+        # Sensor points colored by PM2.5 value
+        _AX.scatter(samples['longitude'], samples['latitude'], c=samples[pollutant], cmap=HEATMAP_CMAP, s=40)
 
-    # Validate input
-    if not all([latitude, longitude]):
-        error_msg = 'Missing required fields: latitude or longitude'
-        print(f"Validation error: {error_msg}")
-        return jsonify({'error': error_msg}), 400
+        # Add colorbar with AQI labels
+        cbar = _FIG.colorbar(im, cax=_CAX, label=f'{pollutant} (µg/m³)', orientation='vertical')
+        cbar.set_ticks([0, 12, 35.4, 55.4, 100])
+        cbar.set_ticklabels(['Good', 'Moderate', 'Unhealthy\n(Sensitive)', 'Unhealthy', 'Very Unhealthy'])
+        cbar.ax.tick_params(labelsize=4.7)  # Reduced font size (8 / 3)
+        cbar.set_label(f'{pollutant} (µg/m³)', fontsize=2.7)  # Reduced font size (8 / 3)
 
-    # Make prediction using current date and time
+        # Basemap
+        ctx.add_basemap(_AX, crs="EPSG:4326", source=ctx.providers.OpenStreetMap.Mapnik)
+
+        # Remove x and y axis markings (tick marks and labels)
+        _AX.set_xticks([])  # Remove x-axis tick marks
+        _AX.set_yticks([])  # Remove y-axis tick marks
+
+        # Labels are already commented out, ensuring no axis labels appear
+        # ax.set_xlabel('Longitude', fontsize=8)
+        # ax.set_ylabel('Latitude', fontsize=8)
+
+        # Save the plot to a bytes buffer
+        buf = io.BytesIO()
+        # Fast zlib level 1 instead of the default 6; no Software/timestamp metadata so identical
+        # heatmaps produce identical bytes
+        _FIG.savefig(buf, format='png', dpi=100, bbox_inches='tight',
+                     pil_kwargs={'compress_level': 1, 'optimize': False}, metadata={'Software': None})
+
+    return buf.getvalue()
+
+def _single_merra_cell(lats, lons):
+    """Whether all points fall inside one cell of the predictor's native MERRA-2 grid."""
+    lat_idx, lon_idx = predictor.merra_cells(lats, lons)
+    return lat_idx.min() == lat_idx.max() and lon_idx.min() == lon_idx.max()
+
+def _flat_heatmap_token(date, time_bucket, lat_q, lon_q, radius):
+    """
+    Image token of a uniform heatmap of the single-point PM2.5.
+
+    The token is derived from the arguments and the cache generation, so a heatmap still
+    in the image store is reused by every worker until the next /cache-clear; it is
+    rendered once per location, radius and time bucket.
+    """
+    key = f"{_cache_generation()}_{date}_{time_bucket}_{lat_q}_{lon_q}_{radius}"
+    token = 'flat-' + hashlib.sha1(key.encode()).hexdigest()
     try:
-        result = predictor.predict(
-            date_str=date,
-            lat=float(latitude),
-            lon=float(longitude),
-            time_str=time
-        )
+        # Restart its expiry so it stays servable for another HEATMAP_IMAGE_TTL
+        os.utime(os.path.join(HEATMAP_IMAGE_DIR, f'{token}.png'))
+        return token
+    except FileNotFoundError:
+        pass
+    value = _cached_predict(date, time_bucket, lat_q, lon_q)['PM2.5']['value']
+    grid_offsets = _grid_offsets(radius, GRID_RES)
+    samples = {'latitude': np.array([lat_q]), 'longitude': np.array([lon_q]), 'PM2_5': np.array([value])}
+    z = np.full((grid_offsets.size, grid_offsets.size), value)
+    return _store_heatmap_image(_render_heatmap(samples, lon_q + grid_offsets, lat_q + grid_offsets, z), token)
+
+def _store_heatmap_image(png_bytes, token=None):
+    """Save a rendered heatmap to the image store, evicting expired images, and return its token."""
+    now = datetime.now().timestamp()
+    for name in os.listdir(HEATMAP_IMAGE_DIR):
+        path = os.path.join(HEATMAP_IMAGE_DIR, name)
+        if path == _CACHE_GENERATION_PATH:
+            continue
+        try:
+            if now - os.path.getmtime(path) > HEATMAP_IMAGE_TTL:
+                os.remove(path)
+        except OSError:
+            pass  # Already evicted by another worker
+    token = token or uuid.uuid4().hex
+    # Write then rename so a worker serving the same token never reads a partial file
+    path = os.path.join(HEATMAP_IMAGE_DIR, f'{token}.png')
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(png_bytes)
+    os.replace(tmp_path, path)
+    return token
+
+def _predict_response(date, time, latitude, longitude):
+    """Run a cached single-point prediction and format it as expected by the frontend."""
+    try:
+        result = _cached_predict(date, time, round(float(latitude), 3), round(float(longitude), 3))
+        print(f"Prediction cache: {_memoized_predict.cache_info()}")
         print(f"Prediction successful for lat={latitude}, lon={longitude}")
         print(f"Prediction result: {result}")
 
@@ -107,9 +326,95 @@ def predict():
         print(traceback.format_exc())
         return jsonify({'error': error_msg}), 500
 
+# Define API endpoint for predictions
+@app.route('/predict', methods=['POST'])
+def predict():
+    print("Received request for /predict")
+    
+    if predictor is None:
+        error_msg = "HighAccuracyEnvironmentalPredictor failed to initialize. Check server logs for details."
+        print(error_msg)
+        return jsonify({'error': error_msg}), 500
+
+    # Get current date and time in the required format
+    current_time = datetime.now()
+    date = current_time.strftime("%Y%m%d")  # Format: YYYYMMDD (e.g., 20250514)
+    time = _time_bucket(current_time)       # Format: HH:MM, rounded down to the cache bucket
+
+    # Get latitude and longitude from the request
+    data = request.json
+    if not data:
+        error_msg = "No JSON data provided in the request."
+        print(f"Validation error: {error_msg}")
+        return jsonify({'error': error_msg}), 400
+
+    latitude = data.get('latitude')
+    longitude = data.get('longitude')
+
+    # Validate input
+    if not all([latitude, longitude]):
+        error_msg = 'Missing required fields: latitude or longitude'
+        print(f"Validation error: {error_msg}")
+        return jsonify({'error': error_msg}), 400
+
+    # Make prediction using current date and time
+    return _predict_response(date, time, latitude, longitude)
+
+# Legacy prediction API (formerly datacollector.py) taking an explicit date and time
+@app.route('/v1/predict', methods=['POST'])
+def predict_v1():
+    print("Received request for /v1/predict")
+
+    if predictor is None:
+        error_msg = "HighAccuracyEnvironmentalPredictor failed to initialize. Check server logs for details."
+        print(error_msg)
+        return jsonify({'error': error_msg}), 500
+
+    data = request.json
+    if not data:
+        error_msg = "No JSON data provided in the request."
+        print(f"Validation error: {error_msg}")
+        return jsonify({'error': error_msg}), 400
+
+    date = data.get('date')
+    latitude = data.get('latitude')
+    longitude = data.get('longitude')
+    time = data.get('time')
+
+    # Validate input
+    if not all([date, latitude, longitude, time]):
+        error_msg = 'Missing required fields: date, latitude, longitude, or time'
+        print(f"Validation error: {error_msg}")
+        return jsonify({'error': error_msg}), 400
+
+    return _predict_response(date, time, latitude, longitude)
+
 @app.route('/heatmap-data', methods=['POST'])
 def heatmap_data():
-    print("Received request for /heatmap-data")
+    return _heatmap_response(raw=False)
+
+@app.route('/heatmap-data-json', methods=['POST'])
+def heatmap_data_json():
+    return _heatmap_response(raw=True)
+
+def _heatmap_grid_response(grid_lon, grid_lat, z):
+    """JSON response with the raw heatmap grid; colormap metadata lets the frontend render it itself."""
+    return jsonify({
+        'z': z.tolist(),
+        'extent': [float(grid_lon[0]), float(grid_lon[-1]), float(grid_lat[0]), float(grid_lat[-1])],
+        'cmap': HEATMAP_CMAP,
+        'vmin': 0,
+        'vmax': 100
+    })
+
+def _heatmap_image_response(token):
+    """Return the URL of a stored heatmap; 'heatmap_image' stays usable as an <img src>."""
+    image_url = url_for('heatmap_image', token=token, _external=True)
+    return jsonify({'heatmap_image': image_url, 'image_url': image_url})
+
+def _heatmap_response(raw):
+    """Shared handler for the heatmap routes: a rendered PNG, or the raw kriged grid when raw=True."""
+    print(f"Received request for {request.path}")
     
     # Get latitude, longitude, and radius from the request
     data = request.json
@@ -131,133 +436,98 @@ def heatmap_data():
         # Convert to float
         latitude = float(latitude)
         longitude = float(longitude)
+        radius = float(radius)
 
         # Get current date and time for predictions
         current_time = datetime.now()
         date = current_time.strftime("%Y%m%d")  # Format: YYYYMMDD (e.g., 20250514)
-        time = current_time.strftime("%H:%M")   # Format: HH:MM (e.g., 16:28)
+        time = _time_bucket(current_time)       # Format: HH:MM, rounded down to the cache bucket
 
         # Generate multiple points around the clicked location for spatial variation
+        # Seeded from the rounded location and date (not the global NumPy RNG) so identical
+        # clicks sample identical, cacheable points and concurrent requests don't race
         n_points = 50
-        np.random.seed(42)
-        lat_offsets = np.random.uniform(-radius, radius, n_points)
-        lon_offsets = np.random.uniform(-radius, radius, n_points)
-        
-        # Collect predicted data for each point
+        rng = np.random.default_rng(zlib.crc32(f"{latitude:.3f}_{longitude:.3f}_{date}".encode()))
+        lat_offsets = rng.uniform(-radius, radius, n_points)
+        lon_offsets = rng.uniform(-radius, radius, n_points)
+        lats = latitude + lat_offsets
+        lons = longitude + lon_offsets
+
+        # If every point falls in the same MERRA-2 cell they all share one prediction and the
+        # Kriging system is degenerate, so skip the batch prediction and Kriging and show a
+        # flat heatmap of the single-point prediction instead
+        if _single_merra_cell(lats, lons):
+            lat_q, lon_q = round(latitude, 3), round(longitude, 3)
+            result = _cached_predict(date, time, lat_q, lon_q)
+            if 'error' in result:
+                error_msg = result.get('message', 'Prediction failed.')
+                print(f"Error in prediction: {result['error']}")
+                return jsonify({'error': error_msg}), 500
+            if raw:
+                grid_offsets = _grid_offsets(radius, GRID_RES)
+                z = np.full((grid_offsets.size, grid_offsets.size), result['PM2.5']['value'])
+                return _heatmap_grid_response(longitude + grid_offsets, latitude + grid_offsets, z)
+            return _heatmap_image_response(_flat_heatmap_token(date, time, lat_q, lon_q, radius))
+
+        # Predict all points with a single batched model call
+        result = _cached_predict_batch(
+            date, time,
+            tuple(np.round(lats, 3).tolist()),
+            tuple(np.round(lons, 3).tolist())
+        )
+        print(f"Heatmap prediction cache: {_memoized_predict_batch.cache_info()}")
+        if 'error' in result:
+            error_msg = result.get('message', 'Prediction failed.')
+            print(f"Error in batch prediction: {result['error']}")
+            return jsonify({'error': error_msg}), 500
+
         data = {
-            'latitude': [],
-            'longitude': [],
-            'VOC': [],
-            'CO2': [],
-            'PM1_0': [],
-            'PM2_5': [],
-            'PM10': []
+            'latitude': lats,
+            'longitude': lons,
+            'VOC': result['VOC']['value'],
+            'CO2': result['CO2']['value'],
+            'PM1_0': result['PM1.0']['value'],
+            'PM2_5': result['PM2.5']['value'],
+            'PM10': result['PM10']['value']
         }
 
-        for lat_offset, lon_offset in zip(lat_offsets, lon_offsets):
-            lat = latitude + lat_offset
-            lon = longitude + lon_offset
-
-            # Make prediction for this point
-            try:
-                result = predictor.predict(
-                    date_str=date,
-                    lat=float(lat),
-                    lon=float(lon),
-                    time_str=time
-                )
-                if 'error' in result:
-                    continue  # Skip points with prediction errors
-
-                # Append the predicted values
-                data['latitude'].append(lat)
-                data['longitude'].append(lon)
-                data['VOC'].append(result['VOC']['value'])
-                data['CO2'].append(result['CO2']['value'])
-                data['PM1_0'].append(result['PM1.0']['value'])
-                data['PM2_5'].append(result['PM2.5']['value'])
-                data['PM10'].append(result['PM10']['value'])
-            except Exception as e:
-                print(f"Error predicting for lat={lat}, lon={lon}: {str(e)}")
-                continue
-
-        # Create DataFrame from predicted data
-        if not data['latitude']:  # Check if data is empty
+        # Drop points with invalid predictions
+        valid = ~np.any(np.isnan(np.column_stack(list(data.values()))), axis=1)
+        if not valid.any():
             error_msg = "No valid predictions obtained for the heatmap."
             print(error_msg)
             return jsonify({'error': error_msg}), 500
 
-        df = pd.DataFrame(data)
-        geometry = [Point(xy) for xy in zip(df['longitude'], df['latitude'])]
-        gdf = gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
-
-        # Define pollutant for the heatmap
-        pollutant = 'PM2_5'
-
-        # Grid setup
-        lon_min, lon_max = df['longitude'].min(), df['longitude'].max()
-        lat_min, lat_max = df['latitude'].min(), df['latitude'].max()
-        grid_res = 0.0045
-        grid_lon = np.arange(lon_min, lon_max, grid_res)
-        grid_lat = np.arange(lat_min, lat_max, grid_res)
-        grid_lon, grid_lat = np.meshgrid(grid_lon, grid_lat)
-
-        # Kriging
-        OK = OrdinaryKriging(
-            df['longitude'], df['latitude'], df[pollutant],
-            variogram_model='spherical',
-            verbose=False, enable_plotting=False
-        )
-        z, ss = OK.execute('grid', grid_lon[0, :], grid_lat[:, 0])
-
-        # AQI categories for PM2.5 (US EPA style)
-        aqi_bins = [0, 12, 35.4, 55.4, 150.4, 250.4, 500]
-        aqi_labels = ['Good', 'Moderate', 'Unhealthy for Sensitive Groups',
-                      'Unhealthy', 'Very Unhealthy', 'Hazardous']
-        aqi_colors = ['#00e400', '#ffff00', '#ff7e00', '#ff0000', '#8f3f97', '#7e0023']
-
-        # Plot
-        fig, ax = plt.subplots(figsize=(24, 16))
-        im = ax.imshow(z, extent=(lon_min, lon_max, lat_min, lat_max), origin='lower',
-                       cmap='RdYlGn_r', vmin=0, vmax=100, alpha=0.8)
-
-        # Sensor points colored by PM2.5 value
-        gdf.plot(ax=ax, column=pollutant, cmap='RdYlGn_r', markersize=40, legend=False)
+        # Sample coordinates and values stay float64 NumPy arrays through Kriging and plotting
+        samples = {key: values[valid] for key, values in data.items()}
 
-        # Add colorbar with AQI labels
-        cbar = plt.colorbar(im, ax=ax, label=f'{pollutant} (µg/m³)', orientation='vertical')
-        cbar.set_ticks([0, 12, 35.4, 55.4, 100])
-        cbar.set_ticklabels(['Good', 'Moderate', 'Unhealthy\n(Sensitive)', 'Unhealthy', 'Very Unhealthy'])
-        cbar.ax.tick_params(labelsize=4.7)  # Reduced font size (8 / 3)
-        cbar.set_label(f'{pollutant} (µg/m³)', fontsize=2.7)  # Reduced font size (8 / 3)
-
-        # Basemap
-        ctx.add_basemap(ax, crs=gdf.crs.to_string(), source=ctx.providers.OpenStreetMap.Mapnik)
-
-        # Remove x and y axis markings (tick marks and labels)
-        ax.set_xticks([])  # Remove x-axis tick marks
-        ax.set_yticks([])  # Remove y-axis tick marks
-
-        # Labels are already commented out, ensuring no axis labels appear
-        # ax.set_xlabel('Longitude', fontsize=8)
-        # ax.set_ylabel('Latitude', fontsize=8)
-
-        # Save the plot to a bytes buffer and encode as base64
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-        plt.close(fig)  # Explicitly close the figure to free memory
-        buf.seek(0)
-        image_base64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-        buf.close()
-
-        # Return the base64-encoded image
-        return jsonify({'heatmap_image': f'data:image/png;base64,{image_base64}'})
+        # Kriging and plotting run outside the model gate
+        grid_lon, grid_lat, z = _krige_heatmap(samples, latitude, longitude, radius)
+        if raw:
+            return _heatmap_grid_response(grid_lon, grid_lat, z)
+        return _heatmap_image_response(_store_heatmap_image(_render_heatmap(samples, grid_lon, grid_lat, z)))
     except Exception as e:
         error_msg = f"Failed to generate heatmap: {str(e)}"
-        print(f"Error in heatmap_data: {error_msg}")
+        print(f"Error in {request.path}: {error_msg}")
         print(traceback.format_exc())
         return jsonify({'error': error_msg}), 500
 
-# Run the Flask app
-if __name__ == '__main__': 
-    app.run(debug=True)
\ No newline at end of file
+@app.route('/heatmap-image/<token>', methods=['GET'])
+def heatmap_image(token):
+    return send_from_directory(HEATMAP_IMAGE_DIR, f'{token}.png', mimetype='image/png',
+                               max_age=HEATMAP_IMAGE_TTL)
+
+@app.route('/cache-clear', methods=['POST'])
+def cache_clear():
+    print("Received request for /cache-clear")
+    # Publish a new generation to every worker; each clears its caches on its next prediction
+    tmp_path = f'{_CACHE_GENERATION_PATH}.{uuid.uuid4().hex}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(uuid.uuid4().hex)
+    os.replace(tmp_path, _CACHE_GENERATION_PATH)
+    _cache_generation()
+    return jsonify({'status': 'Prediction caches cleared'})
+
+# Run the Flask development server; in production serve with gunicorn (see Procfile)
+if __name__ == '__main__':
+    app.run(threaded=True)
@@ -1,568 +1,1161 @@
-import tensorflow as tf
 import numpy as np
 from datetime import datetime
 import math
+from functools import lru_cache, partial
 from typing import Tuple, Dict, List
 import warnings
 from dateutil.relativedelta import relativedelta
-import random
+import os
+import shutil
+import threading
+import weakref
 
 from .region import RegionType
-from .utils import generate_deterministic_variation
+from .utils import NUMBA_AVAILABLE, njit
 
-# Suppress TensorFlow warnings
-tf.get_logger().setLevel('ERROR')
-warnings.filterwarnings('ignore')
+# TensorFlow is imported by the first predictor constructed, so importing the
+# package (e.g. for the utilities or tests) doesn't pay the multi-second import
+tf = None
+
+def _import_tensorflow():
+    """Import TensorFlow on first use and apply this module's TF settings."""
+    global tf
+    if tf is None:
+        import tensorflow
+        # Suppress TensorFlow warnings
+        tensorflow.get_logger().setLevel('ERROR')
+        # Only the inference function opts into XLA; keep global auto-clustering off
+        tensorflow.config.optimizer.set_jit(False)
+        tf = tensorflow
+    return tf
+
+# Fixed order of the environmental variables in value vectors
+VARIABLES = ('temperature', 'humidity', 'pressure', 'gas_resistance', 'CO2', 'VOC', 'PM1.0', 'PM2.5', 'PM10')
+_TEMPERATURE, _HUMIDITY = 0, 1
+_POLLUTANTS = slice(4, 9)  # CO2, VOC, PM1.0, PM2.5, PM10
+
+# Sensor readings produced from the value vectors, in the order of the arrays
+# returned by _calculate_enhanced_values, and the VARIABLES entry each comes from
+_OUTPUT_FIELDS = (('BME688', 'temperature'), ('BME688', 'humidity'), ('BME688', 'pressure'),
+                  ('BME688', 'gas_resistance'), ('MCP9808', 'temperature'), ('CO2', 'value'),
+                  ('VOC', 'value'), ('PM1.0', 'value'), ('PM2.5', 'value'), ('PM10', 'value'))
+_OUTPUT_SOURCE = np.array([0, 1, 2, 3, 0, 4, 5, 6, 7, 8])
+_TEMPERATURE_FIELDS = np.array([0, 4])  # BME688 and MCP9808
+_PRESSURE = 2
+_PARTICULATE_FIELDS = slice(7, 10)  # PM1.0, PM2.5, PM10
+
+# Sigmoid scaling of the two temperature readings
+_SIGMOID_RANGE = np.array([15.0, 15.0])
+_SIGMOID_STEEPNESS = np.array([5.0, 5.0])
+_SIGMOID_HALF_STEEPNESS = _SIGMOID_STEEPNESS / 2
+
+# Exponential scaling of gas resistance, CO2, VOC, PM1.0, PM2.5 and PM10
+_EXP_FIELDS = np.array([3, 5, 6, 7, 8, 9])
+_EXP_RANGE = np.array([150000.0, 600.0, 400.0, 25.0, 30.0, 40.0])
+_INV_EXP3 = math.exp(-3.0)  # normalizes exp(3 * activity) to 1 at full activity
+
+# Keeps the activity normalization finite for a flat model output
+_RANGE_EPSILON = 1e-7
+
+# Sensor noise is uniform within ±max(|value| * relative, minimum)
+_NOISE_RELATIVE = np.array([0.01, 0.005, 0.001, 0.02, 0.01, 0.02, 0.02, 0.05, 0.05, 0.05])
+_NOISE_MINIMUM = np.array([0.1, 0.1, 0.1, 0.1, 0.1, 1.0, 0.5, 0.1, 0.1, 0.1])
+
+# Largest batch handed to the model at once; bigger batches are run in chunks
+_MAX_MODEL_BATCH = 256
+
+# Row order of the seasonal and diurnal adjustment arrays
+_SEASONS = ('spring', 'summer', 'fall', 'winter')
+_TIMES_OF_DAY = ('morning', 'afternoon', 'evening', 'night')
+
+# Extra regional pollution boost applied to CO2, VOC, PM1.0, PM2.5, PM10
+_URBAN_POLLUTION_BOOST = np.array([1.0, 1.2, 1.0, 1.3, 1.4])
+_RURAL_POLLUTION_BOOST = np.array([1.0, 1.1, 1.0, 1.2, 1.2])
+
+# fastmath flags for the kernels fed by model outputs: everything but the no-NaN/no-Inf
+# assumptions, so a NaN output gives NaN readings as on the NumPy path
+_MODEL_OUTPUT_FASTMATH = {'reassoc', 'contract', 'arcp', 'nsz', 'afn'}
+
+@njit(cache=True, fastmath=True)
+def _dt_features(yday: int, month: int, hour: int, minute: int) -> Tuple[float, float, float, float, float, int, int]:
+    """Year progress, seasonal/diurnal sin and cos, and season/time-of-day indices into _SEASONS/_TIMES_OF_DAY."""
+    year_progress = (yday - 1) / 365.0
+    seasonal_sin = math.sin(2 * math.pi * year_progress)
+    seasonal_cos = math.cos(2 * math.pi * year_progress)
+    diurnal_progress = (hour * 60 + minute) / (24 * 60)
+    diurnal_sin = math.sin(2 * math.pi * diurnal_progress)
+    diurnal_cos = math.cos(2 * math.pi * diurnal_progress)
+    if 3 <= month <= 5:
+        season_idx = 0
+    elif 6 <= month <= 8:
+        season_idx = 1
+    elif 9 <= month <= 11:
+        season_idx = 2
+    else:
+        season_idx = 3
+    if 5 <= hour < 11:
+        time_of_day_idx = 0
+    elif 11 <= hour < 16:
+        time_of_day_idx = 1
+    elif 16 <= hour < 21:
+        time_of_day_idx = 2
+    else:
+        time_of_day_idx = 3
+    return year_progress, seasonal_sin, seasonal_cos, diurnal_sin, diurnal_cos, season_idx, time_of_day_idx
+
+@njit(cache=True, fastmath=True)
+def _merra_index(lat: float, lon: float, lat_min: float, lat_max: float, lon_min: float, lon_max: float,
+                 lat_res: float, lon_res: float, n_lat: int, n_lon: int) -> Tuple[int, int]:
+    """Clamp a location to the grid and return its (lat_idx, lon_idx) MERRA-2 cell."""
+    lat = max(min(lat, lat_max), lat_min)
+    lon = max(min(lon, lon_max), lon_min)
+    lat_idx = int((lat_max - lat) / lat_res)
+    lon_idx = int((lon - lon_min) / lon_res)
+    # lat_min/lon_max fall on the far edge of the last cell
+    return min(lat_idx, n_lat - 1), min(lon_idx, n_lon - 1)
+
+# Major city centres (lat, lon); locations within ±1.0° lat and ±1.5° lon count as urban
+_MAJOR_CITIES = np.array([
+    (40.7, -74.0), (51.5, -0.1), (35.7, 139.7), (19.1, 72.9),
+    (34.1, -118.2), (41.9, 12.5), (-23.5, -46.6), (30.0, 31.2),
+    (39.9, 116.4), (55.8, 37.6)
+])
+
+# RegionType values as plain ints for the jitted classifier
+_OCEAN = RegionType.OCEAN.value
+_COASTAL = RegionType.COASTAL.value
+_FOREST_TROPICAL = RegionType.FOREST_TROPICAL.value
+_FOREST_TEMPERATE = RegionType.FOREST_TEMPERATE.value
+_GRASSLAND = RegionType.GRASSLAND.value
+_DESERT = RegionType.DESERT.value
+_TUNDRA = RegionType.TUNDRA.value
+_URBAN = RegionType.URBAN.value
+_MOUNTAIN = RegionType.MOUNTAIN.value
+_AGRICULTURAL = RegionType.AGRICULTURAL.value
+
+# RegionType members indexed by value, so grid lookups skip the Enum value lookup
+_REGION_TYPES = tuple(RegionType)
+
+@njit(cache=True)
+def _classify_region(lat: float, lon: float) -> int:
+    """
+    Determine the RegionType value based on latitude and longitude.
+
+    Urban areas are not detected here: the major-city test only applies to
+    locations that end up GRASSLAND or AGRICULTURAL, so callers override those
+    with _near_major_city.
+    """
+    if (abs(lat) < 30 and ((0 < lon < 20) or (60 < lon < 100) or (140 < lon < 180) or
+        (-140 < lon < -60) or (-20 < lon < 0))):
+        return _OCEAN
+    if ((15 < lat < 35 and -120 < lon < -80) or
+        (15 < lat < 30 and -10 < lon < 50) or
+        (20 < lat < 35 and 50 < lon < 80) or
+        (-30 < lat < -15 and 115 < lon < 150) or
+        (-30 < lat < -15 and -80 < lon < -60)):
+        return _DESERT
+    if ((-10 < lat < 10 and -80 < lon < -50) or
+        (-10 < lat < 10 and 10 < lon < 40) or
+        (-10 < lat < 10 and 90 < lon < 150)):
+        return _FOREST_TROPICAL
+    if (((40 < lat < 60 and -10 < lon < 30) or
+         (40 < lat < 60 and -130 < lon < -70) or
+         (30 < lat < 50 and 120 < lon < 150))):
+        return _FOREST_TEMPERATE
+    if (lat > 60 or lat < -60):
+        return _TUNDRA
+    if ((35 < lat < 45 and -120 < lon < -105) or
+        (-35 < lat < -20 and -75 < lon < -60) or
+        (30 < lat < 40 and 70 < lon < 90) or
+        (45 < lat < 50 and 5 < lon < 15)):
+        return _MOUNTAIN
+    if (abs(lon) < 10 or abs(lon) > 170 or
+        (abs(lat) < 30 and (abs(lon) < 100 and abs(lon) > 80))):
+        return _COASTAL
+    if ((25 < lat < 50 and -105 < lon < -75) or
+        (45 < lat < 55 and -5 < lon < 30) or
+        (-40 < lat < -20 and -65 < lon < -50) or
+        (20 < lat < 40 and 70 < lon < 100)):
+        return _AGRICULTURAL
+    return _GRASSLAND
+
+@njit(cache=True)
+def _classify_regions(lats: np.ndarray, lons: np.ndarray, out: np.ndarray) -> None:
+    """Classify many locations into RegionType values (urban excepted), writing them to out."""
+    for i in range(lats.shape[0]):
+        out[i] = _classify_region(lats[i], lons[i])
+
+@njit(cache=True, fastmath=True)
+def _fill_patches(patterns: np.ndarray, regions: np.ndarray, pattern_index: np.ndarray, seasonal_gain: np.ndarray,
+                  diurnal_gain: np.ndarray, region_elevations: np.ndarray, seasonal_term: float,
+                  diurnal_term: float, out: np.ndarray) -> None:
+    """
+    Fill (N, 3, 128, 128, 1) synthetic patches in a single pass over the pixels.
+
+    Each pixel is clip(pattern * scale, 0.1, 1.0) * elevation_factor, written to the
+    last frame and, scaled by 0.85 and 0.93, to the two earlier frames. The pattern,
+    scale and elevation factor come from the per-RegionType tables and the
+    seasonal/diurnal terms shared by all locations.
+    """
+    for n in range(out.shape[0]):
+        region = regions[n]
+        scale = np.float32((1 + seasonal_term * seasonal_gain[region]) * (1 + diurnal_term * diurnal_gain[region] * 0.5))
+        elevation_factor = np.float32(1.0 - min(1.0, region_elevations[region] / 5000.0))
+        pattern = patterns[pattern_index[region]]
+        for i in range(patterns.shape[1]):
+            for j in range(patterns.shape[2]):
+                value = min(np.float32(1.0), max(np.float32(0.1), pattern[i, j] * scale)) * elevation_factor
+                out[n, 0, i, j, 0] = value * np.float32(0.85)
+                out[n, 1, i, j, 0] = value * np.float32(0.93)
+                out[n, 2, i, j, 0] = value
+
+@njit(cache=True, fastmath=_MODEL_OUTPUT_FASTMATH)
+def _summarize_outputs(preds: np.ndarray, activity: np.ndarray, uncertainty: np.ndarray) -> None:
+    """
+    Reduce (N, 128, 128, 2) model outputs to per-sample statistics in one sweep.
+
+    Writes the normalized activity, (mean - min) / (max - min + _RANGE_EPSILON) of the mean
+    channel, to activity and the mean of the uncertainty channel to uncertainty.
+    """
+    size = preds.shape[1] * preds.shape[2]
+    for n in range(preds.shape[0]):
+        low = preds[n, 0, 0, 0]
+        high = low
+        total = 0.0
+        total_uncertainty = 0.0
+        for i in range(preds.shape[1]):
+            for j in range(preds.shape[2]):
+                value = preds[n, i, j, 0]
+                low = min(low, value)
+                high = max(high, value)
+                total += value
+                total_uncertainty += preds[n, i, j, 1]
+        activity[n] = (total / size - low) / (high - low + _RANGE_EPSILON)
+        uncertainty[n] = total_uncertainty / size
+
+@njit(cache=True, fastmath=True)
+def _adjust_row(base_values: np.ndarray, region: int, temp_shift: np.ndarray, temp_gain: float,
+                humidity_shift: np.ndarray, pollution_factor: np.ndarray, out: np.ndarray) -> None:
+    """Seasonal/diurnal adjustment of one value vector ordered as VARIABLES, written to out."""
+    boost = _URBAN_POLLUTION_BOOST if region == _URBAN else _RURAL_POLLUTION_BOOST
+    for k in range(base_values.shape[0]):
+        out[k] = base_values[k]
+    out[0] += temp_shift[region] * temp_gain
+    out[1] = min(100.0, max(10.0, out[1] + humidity_shift[region]))
+    for k in range(boost.shape[0]):
+        out[4 + k] *= pollution_factor[region] * boost[k]
+
+@njit(cache=True, fastmath=_MODEL_OUTPUT_FASTMATH)
+def _enhance_row(activity: float, adjusted_values: np.ndarray, out: np.ndarray) -> None:
+    """
+    Scale one value vector by the model activity into noisy readings ordered as _OUTPUT_FIELDS.
+
+    Same steps as _calculate_enhanced_values, with the uniform noise drawn from
+    numba's per-thread generator.
+    """
+    for k in range(out.shape[0]):
+        out[k] = adjusted_values[_OUTPUT_SOURCE[k]]
+    for k in range(_TEMPERATURE_FIELDS.shape[0]):
+        out[_TEMPERATURE_FIELDS[k]] += _SIGMOID_RANGE[k] * (1 + math.tanh(_SIGMOID_HALF_STEEPNESS[k] * (activity - 0.5)))
+    growth = math.exp(3 * activity) * _INV_EXP3
+    for k in range(_EXP_FIELDS.shape[0]):
+        out[_EXP_FIELDS[k]] += _EXP_RANGE[k] * growth
+    out[_HUMIDITY] = min(100.0, max(10.0, out[_HUMIDITY] + activity * 50))
+    out[_PRESSURE] = min(1050.0, max(950.0, out[_PRESSURE] - activity * 5))
+    for k in range(out.shape[0]):
+        noise_scale = max(abs(out[k]) * _NOISE_RELATIVE[k], _NOISE_MINIMUM[k])
+        out[k] += (2.0 * np.random.random() - 1.0) * noise_scale
+    for k in range(7, 10):  # _PARTICULATE_FIELDS
+        out[k] = max(out[k], 0.0)
+
+@njit(cache=True, fastmath=_MODEL_OUTPUT_FASTMATH)
+def _constrain_row(readings: np.ndarray, elevation: float, calibration: np.ndarray) -> None:
+    """Elevation correction and pollutant calibration of one reading vector, in place."""
+    elevation_factor = 1.0 - min(1.0, elevation / 5000.0)
+    readings[0] -= elevation_factor * 2.0
+    readings[4] -= elevation_factor * 2.0
+    readings[2] *= 1 - elevation_factor * 0.00012
+    for k in range(readings.shape[0]):
+        readings[k] *= calibration[k]
+
+@njit(cache=True, fastmath=_MODEL_OUTPUT_FASTMATH)
+def _fused_readings(normalized_means: np.ndarray, regions: np.ndarray, base_values: np.ndarray,
+                    temp_shift: np.ndarray, temp_gain: float, humidity_shift: np.ndarray,
+                    pollution_factor: np.ndarray, region_elevations: np.ndarray, calibration: np.ndarray,
+                    out: np.ndarray) -> None:
+    """
+    Temporal adjustment, enhanced scaling and physics constraints of N locations in one pass.
+
+    Each location's value vector lives in a 9-element scratch array and its readings
+    are written straight to row n of the (N, 10) out; base_values, region_elevations
+    and calibration are the per-RegionType tables.
+    """
+    adjusted_values = np.empty(base_values.shape[1])
+    for n in range(out.shape[0]):
+        region = regions[n]
+        _adjust_row(base_values[region], region, temp_shift, temp_gain, humidity_shift, pollution_factor,
+                    adjusted_values)
+        _enhance_row(normalized_means[n], adjusted_values, out[n])
+        _constrain_row(out[n], region_elevations[region], calibration[region])
+
+def _near_major_city(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Boolean mask of the locations within the urban box around any major city."""
+    return np.any((np.abs(lats[:, None] - _MAJOR_CITIES[:, 0]) < 1.0) &
+                  (np.abs(lons[:, None] - _MAJOR_CITIES[:, 1]) < 1.5), axis=1)
+
+def _readings_to_dict(readings: np.ndarray) -> Dict:
+    """
+    Nest readings ordered as _OUTPUT_FIELDS into {sensor: {field: value}}.
+
+    A (10,) vector gives float values, an (N, 10) array gives one array of N values per field.
+    """
+    # One literal instead of building the nesting key by key; keep in step with _OUTPUT_FIELDS
+    (bme_temperature, humidity, pressure, gas_resistance, mcp_temperature,
+     co2, voc, pm1, pm25, pm10) = readings.tolist() if readings.ndim == 1 else readings.T.copy()
+    return {
+        'BME688': {'temperature': bme_temperature, 'humidity': humidity, 'pressure': pressure,
+                   'gas_resistance': gas_resistance},
+        'MCP9808': {'temperature': mcp_temperature},
+        'CO2': {'value': co2},
+        'VOC': {'value': voc},
+        'PM1.0': {'value': pm1},
+        'PM2.5': {'value': pm25},
+        'PM10': {'value': pm10}
+    }
+
+def _parse_datetime(date_str: str, time_str: str = None) -> datetime:
+    """
+    Parse a YYYYMMDD date and an optional HH:MM time without going through strptime.
+
+    Raises ValueError for malformed or out-of-range input, as strptime would.
+    """
+    date_str = str(date_str)
+    if len(date_str) != 8 or not date_str.isdigit():
+        raise ValueError(f"time data {date_str!r} does not match format '%Y%m%d'")
+    hour = minute = 0
+    if time_str:
+        hour_str, separator, minute_str = str(time_str).partition(':')
+        if not (separator and 1 <= len(hour_str) <= 2 and 1 <= len(minute_str) <= 2
+                and hour_str.isdigit() and minute_str.isdigit()):
+            raise ValueError(f"time data {time_str!r} does not match format '%H:%M'")
+        hour, minute = int(hour_str), int(minute_str)
+    return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]), hour, minute)
+
+@lru_cache(maxsize=4096)
+def _temporal_features(dt: datetime) -> Dict:
+    """Temporal features of a datetime, memoized since batches and sweeps repeat the same few datetimes."""
+    (year_progress, seasonal_sin, seasonal_cos, diurnal_sin, diurnal_cos,
+     season_idx, time_of_day_idx) = _dt_features(dt.timetuple().tm_yday, dt.month, dt.hour, dt.minute)
+    return {
+        'year_progress': year_progress,
+        'seasonal_sin': seasonal_sin,
+        'seasonal_cos': seasonal_cos,
+        'diurnal_sin': diurnal_sin,
+        'diurnal_cos': diurnal_cos,
+        'season': _SEASONS[season_idx],
+        'time_of_day': _TIMES_OF_DAY[time_of_day_idx],
+        'season_idx': season_idx,
+        'time_of_day_idx': time_of_day_idx,
+        'hour': dt.hour,
+        'month': dt.month
+    }
+
+def _reseed_after_fork(predictor_ref: weakref.ref) -> None:
+    """Give a forked child its own NumPy noise stream instead of a copy of the parent's."""
+    predictor = predictor_ref()
+    if predictor is not None:
+        predictor._rng = np.random.default_rng()
+
+def _cache_is_fresh(cache_path: str, source_path: str) -> bool:
+    """Whether a derived file or directory exists and is not older than its source."""
+    return os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(source_path)
 
 class HighAccuracyEnvironmentalPredictor:
-    def __init__(self, model_path: str):
+    # MERRA-2 grid parameters
+    lat_min = -90
+    lat_max = 90
+    lon_min = -180
+    lon_max = 180
+    lat_res = 0.5
+    lon_res = 0.625
+
+    variation_scales = {
+        'temperature': 0.3,    # ±0.3°C
+        'humidity': 1.0,       # ±1.0%
+        'pressure': 0.5,       # ±0.5 hPa
+        'gas_resistance': 1000.0,  # ±1000 ohms
+        'CO2': 2.0,            # ±2.0 ppm
+        'VOC': 5.0,            # ±5.0 ppb
+        'PM1.0': 0.5,          # ±0.5 µg/m³
+        'PM2.5': 0.7,          # ±0.7 µg/m³
+        'PM10': 1.0            # ±1.0 µg/m³
+    }
+    
+    # Regional base values with realistic ranges
+    regional_base_values = {
+        RegionType.OCEAN: {
+            'temperature': 18.0,  # °C
+            'humidity': 85.0,     # %
+            'pressure': 1013.25, # hPa
+            'gas_resistance': 80000.0,  # ohms
+            'CO2': 410.0,        # ppm
+            'VOC': 80.0,         # ppb
+            'PM1.0': 2.0,         # µg/m³
+            'PM2.5': 3.0,         # µg/m³
+            'PM10': 4.0           # µg/m³
+        },
+        RegionType.COASTAL: {
+            'temperature': 22.0,
+            'humidity': 75.0,
+            'pressure': 1013.0,
+            'gas_resistance': 60000.0,
+            'CO2': 420.0,
+            'VOC': 120.0,
+            'PM1.0': 5.0,
+            'PM2.5': 8.0,
+            'PM10': 10.0
+        },
+        RegionType.FOREST_TROPICAL: {
+            'temperature': 26.0,
+            'humidity': 85.0,
+            'pressure': 1012.0,
+            'gas_resistance': 50000.0,
+            'CO2': 430.0,
+            'VOC': 200.0,
+            'PM1.0': 4.0,
+            'PM2.5': 6.0,
+            'PM10': 8.0
+        },
+        RegionType.FOREST_TEMPERATE: {
+            'temperature': 18.0,
+            'humidity': 70.0,
+            'pressure': 1013.0,
+            'gas_resistance': 55000.0,
+            'CO2': 425.0,
+            'VOC': 150.0,
+            'PM1.0': 3.0,
+            'PM2.5': 5.0,
+            'PM10': 7.0
+        },
+        RegionType.GRASSLAND: {
+            'temperature': 20.0,
+            'humidity': 60.0,
+            'pressure': 1013.0,
+            'gas_resistance': 50000.0,
+            'CO2': 420.0,
+            'VOC': 100.0,
+            'PM1.0': 4.0,
+            'PM2.5': 6.0,
+            'PM10': 9.0
+        },
+        RegionType.DESERT: {
+            'temperature': 30.0,
+            'humidity': 20.0,
+            'pressure': 1012.0,
+            'gas_resistance': 30000.0,
+            'CO2': 415.0,
+            'VOC': 50.0,
+            'PM1.0': 10.0,
+            'PM2.5': 25.0,
+            'PM10': 50.0
+        },
+        RegionType.TUNDRA: {
+            'temperature': -5.0,
+            'humidity': 70.0,
+            'pressure': 1015.0,
+            'gas_resistance': 70000.0,
+            'CO2': 410.0,
+            'VOC': 30.0,
+            'PM1.0': 2.0,
+            'PM2.5': 3.0,
+            'PM10': 4.0
+        },
+        RegionType.URBAN: {
+            'temperature': 24.0,
+            'humidity': 65.0,
+            'pressure': 1012.0,
+            'gas_resistance': 40000.0,
+            'CO2': 450.0,
+            'VOC': 300.0,
+            'PM1.0': 10.0,
+            'PM2.5': 20.0,
+            'PM10': 30.0
+        },
+        RegionType.MOUNTAIN: {
+            'temperature': 12.0,
+            'humidity': 60.0,
+            'pressure': 900.0,
+            'gas_resistance': 60000.0,
+            'CO2': 415.0,
+            'VOC': 80.0,
+            'PM1.0': 3.0,
+            'PM2.5': 5.0,
+            'PM10': 7.0
+        },
+        RegionType.AGRICULTURAL: {
+            'temperature': 22.0,
+            'humidity': 65.0,
+            'pressure': 1013.0,
+            'gas_resistance': 45000.0,
+            'CO2': 435.0,
+            'VOC': 180.0,
+            'PM1.0': 6.0,
+            'PM2.5': 12.0,
+            'PM10': 15.0
+        }
+    }
+    
+    # Calibration factors for urban/rural areas
+    calibration_factors = {
+        'urban': {
+            'CO2': 1.1,
+            'VOC': 1.2,
+            'PM': 1.3
+        },
+        'rural': {
+            'CO2': 1.0,
+            'VOC': 1.0,
+            'PM': 1.0
+        }
+    }
+    
+    # Seasonal parameters
+    seasonal_params = {
+        'summer': {
+            'temp_shift': {
+                RegionType.OCEAN: 2.0,
+                RegionType.COASTAL: 4.0,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 6.0,
+                RegionType.GRASSLAND: 8.0,
+                RegionType.DESERT: 12.0,
+                RegionType.TUNDRA: 10.0,
+                RegionType.URBAN: 5.0,
+                RegionType.MOUNTAIN: 4.0,
+                RegionType.AGRICULTURAL: 6.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 5.0,
+                RegionType.COASTAL: 10.0,
+                RegionType.FOREST_TROPICAL: 5.0,
+                RegionType.FOREST_TEMPERATE: 15.0,
+                RegionType.GRASSLAND: -10.0,
+                RegionType.DESERT: -5.0,
+                RegionType.TUNDRA: 20.0,
+                RegionType.URBAN: 5.0,
+                RegionType.MOUNTAIN: 5.0,
+                RegionType.AGRICULTURAL: 8.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.1,
+                RegionType.COASTAL: 1.2,
+                RegionType.FOREST_TROPICAL: 1.1,
+                RegionType.FOREST_TEMPERATE: 1.1,
+                RegionType.GRASSLAND: 1.3,
+                RegionType.DESERT: 1.5,
+                RegionType.TUNDRA: 1.0,
+                RegionType.URBAN: 1.4,
+                RegionType.MOUNTAIN: 1.1,
+                RegionType.AGRICULTURAL: 1.3
+            }
+        },
+        'winter': {
+            'temp_shift': {
+                RegionType.OCEAN: -1.0,
+                RegionType.COASTAL: -3.0,
+                RegionType.FOREST_TROPICAL: 0.0,
+                RegionType.FOREST_TEMPERATE: -8.0,
+                RegionType.GRASSLAND: -10.0,
+                RegionType.DESERT: -5.0,
+                RegionType.TUNDRA: -25.0,
+                RegionType.URBAN: -4.0,
+                RegionType.MOUNTAIN: -6.0,
+                RegionType.AGRICULTURAL: -5.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 0.0,
+                RegionType.COASTAL: 5.0,
+                RegionType.FOREST_TROPICAL: 0.0,
+                RegionType.FOREST_TEMPERATE: -5.0,
+                RegionType.GRASSLAND: -5.0,
+                RegionType.DESERT: -3.0,
+                RegionType.TUNDRA: -10.0,
+                RegionType.URBAN: -5.0,
+                RegionType.MOUNTAIN: -5.0,
+                RegionType.AGRICULTURAL: -3.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 1.1,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 1.2,
+                RegionType.GRASSLAND: 1.4,
+                RegionType.DESERT: 1.2,
+                RegionType.TUNDRA: 1.5,
+                RegionType.URBAN: 1.6,
+                RegionType.MOUNTAIN: 1.3,
+                RegionType.AGRICULTURAL: 1.4
+            }
+        },
+        'spring': {
+            'temp_shift': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 2.0,
+                RegionType.FOREST_TROPICAL: 0.5,
+                RegionType.FOREST_TEMPERATE: 3.0,
+                RegionType.GRASSLAND: 4.0,
+                RegionType.DESERT: 6.0,
+                RegionType.TUNDRA: 5.0,
+                RegionType.URBAN: 2.0,
+                RegionType.MOUNTAIN: 2.0,
+                RegionType.AGRICULTURAL: 3.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 2.0,
+                RegionType.COASTAL: 8.0,
+                RegionType.FOREST_TROPICAL: 3.0,
+                RegionType.FOREST_TEMPERATE: 10.0,
+                RegionType.GRASSLAND: 5.0,
+                RegionType.DESERT: 2.0,
+                RegionType.TUNDRA: 15.0,
+                RegionType.URBAN: 3.0,
+                RegionType.MOUNTAIN: 3.0,
+                RegionType.AGRICULTURAL: 5.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 1.1,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 1.1,
+                RegionType.GRASSLAND: 1.2,
+                RegionType.DESERT: 1.3,
+                RegionType.TUNDRA: 1.1,
+                RegionType.URBAN: 1.3,
+                RegionType.MOUNTAIN: 1.1,
+                RegionType.AGRICULTURAL: 1.2
+            }
+        },
+        'fall': {
+            'temp_shift': {
+                RegionType.OCEAN: 0.5,
+                RegionType.COASTAL: 1.0,
+                RegionType.FOREST_TROPICAL: 0.5,
+                RegionType.FOREST_TEMPERATE: 2.0,
+                RegionType.GRASSLAND: 3.0,
+                RegionType.DESERT: 4.0,
+                RegionType.TUNDRA: 2.0,
+                RegionType.URBAN: 1.0,
+                RegionType.MOUNTAIN: 1.0,
+                RegionType.AGRICULTURAL: 2.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 5.0,
+                RegionType.FOREST_TROPICAL: 2.0,
+                RegionType.FOREST_TEMPERATE: 8.0,
+                RegionType.GRASSLAND: 3.0,
+                RegionType.DESERT: 1.0,
+                RegionType.TUNDRA: 10.0,
+                RegionType.URBAN: 2.0,
+                RegionType.MOUNTAIN: 2.0,
+                RegionType.AGRICULTURAL: 3.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 1.1,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 1.2,
+                RegionType.GRASSLAND: 1.3,
+                RegionType.DESERT: 1.4,
+                RegionType.TUNDRA: 1.2,
+                RegionType.URBAN: 1.4,
+                RegionType.MOUNTAIN: 1.2,
+                RegionType.AGRICULTURAL: 1.3
+            }
+        }
+    }
+    
+    # Diurnal parameters
+    diurnal_params = {
+        'morning': {
+            'temp_shift': {
+                RegionType.OCEAN: -0.5,
+                RegionType.COASTAL: -1.0,
+                RegionType.FOREST_TROPICAL: -0.5,
+                RegionType.FOREST_TEMPERATE: -1.5,
+                RegionType.GRASSLAND: -2.0,
+                RegionType.DESERT: -3.0,
+                RegionType.TUNDRA: -1.0,
+                RegionType.URBAN: -1.0,
+                RegionType.MOUNTAIN: -1.5,
+                RegionType.AGRICULTURAL: -1.5
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 5.0,
+                RegionType.COASTAL: 10.0,
+                RegionType.FOREST_TROPICAL: 5.0,
+                RegionType.FOREST_TEMPERATE: 10.0,
+                RegionType.GRASSLAND: 15.0,
+                RegionType.DESERT: 10.0,
+                RegionType.TUNDRA: 5.0,
+                RegionType.URBAN: 8.0,
+                RegionType.MOUNTAIN: 10.0,
+                RegionType.AGRICULTURAL: 12.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 1.1,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 1.1,
+                RegionType.GRASSLAND: 1.2,
+                RegionType.DESERT: 1.3,
+                RegionType.TUNDRA: 1.0,
+                RegionType.URBAN: 1.3,
+                RegionType.MOUNTAIN: 1.1,
+                RegionType.AGRICULTURAL: 1.2
+            }
+        },
+        'afternoon': {
+            'temp_shift': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 3.0,
+                RegionType.FOREST_TROPICAL: 2.0,
+                RegionType.FOREST_TEMPERATE: 4.0,
+                RegionType.GRASSLAND: 6.0,
+                RegionType.DESERT: 10.0,
+                RegionType.TUNDRA: 3.0,
+                RegionType.URBAN: 4.0,
+                RegionType.MOUNTAIN: 3.0,
+                RegionType.AGRICULTURAL: 5.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: -5.0,
+                RegionType.COASTAL: -10.0,
+                RegionType.FOREST_TROPICAL: -5.0,
+                RegionType.FOREST_TEMPERATE: -10.0,
+                RegionType.GRASSLAND: -15.0,
+                RegionType.DESERT: -5.0,
+                RegionType.TUNDRA: -5.0,
+                RegionType.URBAN: -10.0,
+                RegionType.MOUNTAIN: -10.0,
+                RegionType.AGRICULTURAL: -12.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.0,
+                RegionType.COASTAL: 1.0,
+                RegionType.FOREST_TROPICAL: 1.0,
+                RegionType.FOREST_TEMPERATE: 1.0,
+                RegionType.GRASSLAND: 1.1,
+                RegionType.DESERT: 1.2,
+                RegionType.TUNDRA: 1.0,
+                RegionType.URBAN: 1.2,
+                RegionType.MOUNTAIN: 1.0,
+                RegionType.AGRICULTURAL: 1.1
+            }
+        },
+        'evening': {
+            'temp_shift': {
+                RegionType.OCEAN: 0.5,
+                RegionType.COASTAL: 1.0,
+                RegionType.FOREST_TROPICAL: 0.5,
+                RegionType.FOREST_TEMPERATE: 1.0,
+                RegionType.GRASSLAND: 2.0,
+                RegionType.DESERT: 3.0,
+                RegionType.TUNDRA: 1.0,
+                RegionType.URBAN: 1.0,
+                RegionType.MOUNTAIN: 1.0,
+                RegionType.AGRICULTURAL: 1.5
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 3.0,
+                RegionType.COASTAL: 8.0,
+                RegionType.FOREST_TROPICAL: 3.0,
+                RegionType.FOREST_TEMPERATE: 8.0,
+                RegionType.GRASSLAND: 10.0,
+                RegionType.DESERT: 5.0,
+                RegionType.TUNDRA: 3.0,
+                RegionType.URBAN: 5.0,
+                RegionType.MOUNTAIN: 5.0,
+                RegionType.AGRICULTURAL: 8.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 1.1,
+                RegionType.COASTAL: 1.2,
+                RegionType.FOREST_TROPICAL: 1.1,
+                RegionType.FOREST_TEMPERATE: 1.2,
+                RegionType.GRASSLAND: 1.3,
+                RegionType.DESERT: 1.4,
+                RegionType.TUNDRA: 1.1,
+                RegionType.URBAN: 1.4,
+                RegionType.MOUNTAIN: 1.2,
+                RegionType.AGRICULTURAL: 1.3
+            }
+        },
+        'night': {
+            'temp_shift': {
+                RegionType.OCEAN: -1.0,
+                RegionType.COASTAL: -2.0,
+                RegionType.FOREST_TROPICAL: -1.0,
+                RegionType.FOREST_TEMPERATE: -3.0,
+                RegionType.GRASSLAND: -4.0,
+                RegionType.DESERT: -8.0,
+                RegionType.TUNDRA: -2.0,
+                RegionType.URBAN: -2.0,
+                RegionType.MOUNTAIN: -3.0,
+                RegionType.AGRICULTURAL: -3.0
+            },
+            'humidity_shift': {
+                RegionType.OCEAN: 8.0,
+                RegionType.COASTAL: 15.0,
+                RegionType.FOREST_TROPICAL: 8.0,
+                RegionType.FOREST_TEMPERATE: 15.0,
+                RegionType.GRASSLAND: 20.0,
+                RegionType.DESERT: 15.0,
+                RegionType.TUNDRA: 10.0,
+                RegionType.URBAN: 12.0,
+                RegionType.MOUNTAIN: 15.0,
+                RegionType.AGRICULTURAL: 18.0
+            },
+            'pollution_factor': {
+                RegionType.OCEAN: 0.9,
+                RegionType.COASTAL: 0.9,
+                RegionType.FOREST_TROPICAL: 0.9,
+                RegionType.FOREST_TEMPERATE: 0.9,
+                RegionType.GRASSLAND: 0.9,
+                RegionType.DESERT: 0.8,
+                RegionType.TUNDRA: 0.9,
+                RegionType.URBAN: 1.0,
+                RegionType.MOUNTAIN: 0.9,
+                RegionType.AGRICULTURAL: 0.9
+            }
+        }
+    }
+
+    # Simplified elevation data
+    elevation_data = {
+        'default': 0.0,
+        'mountain_threshold': 1000.0  # meters
+    }
+
+    # Lookup tables derived from the parameters above, built once per process by
+    # the first instance (see _build_tables)
+    _tables_lock = threading.Lock()
+    _tables_built = False
+
+    def __init__(self, model_path: str, quantize: bool = False, validate: bool = False):
         """
         Initialize the high-accuracy environmental predictor with comprehensive regional modeling.
 
         Args:
             model_path: Path to the trained .keras model
+            quantize: Serve inference from an INT8-quantized TFLite model instead of
+                the full-precision Keras model
+            validate: Also run a test inference on construction, which checks the
+                weights and warms up the compiled forward pass
         """
         try:
-            # Load model with enhanced validation
-            self.model = tf.keras.models.load_model(
-                model_path,
-                custom_objects={},
-                compile=False
-            )
-            self._validate_model()
-            
-            # MERRA-2 grid parameters
-            self.lat_min = -90
-            self.lat_max = 90
-            self.lon_min = -180
-            self.lon_max = 180
-            self.lat_res = 0.5
-            self.lon_res = 0.625
-
-            self.variation_scales = {
-                'temperature': 0.3,    # ±0.3°C
-                'humidity': 1.0,       # ±1.0%
-                'pressure': 0.5,       # ±0.5 hPa
-                'gas_resistance': 1000.0,  # ±1000 ohms
-                'CO2': 2.0,            # ±2.0 ppm
-                'VOC': 5.0,            # ±5.0 ppb
-                'PM1.0': 0.5,          # ±0.5 µg/m³
-                'PM2.5': 0.7,          # ±0.7 µg/m³
-                'PM10': 1.0            # ±1.0 µg/m³
-            }
-            
-            # Regional base values with realistic ranges
-            self.regional_base_values = {
-                RegionType.OCEAN: {
-                    'temperature': 18.0,  # °C
-                    'humidity': 85.0,     # %
-                    'pressure': 1013.25, # hPa
-                    'gas_resistance': 80000.0,  # ohms
-                    'CO2': 410.0,        # ppm
-                    'VOC': 80.0,         # ppb
-                    'PM1.0': 2.0,         # µg/m³
-                    'PM2.5': 3.0,         # µg/m³
-                    'PM10': 4.0           # µg/m³
-                },
-                RegionType.COASTAL: {
-                    'temperature': 22.0,
-                    'humidity': 75.0,
-                    'pressure': 1013.0,
-                    'gas_resistance': 60000.0,
-                    'CO2': 420.0,
-                    'VOC': 120.0,
-                    'PM1.0': 5.0,
-                    'PM2.5': 8.0,
-                    'PM10': 10.0
-                },
-                RegionType.FOREST_TROPICAL: {
-                    'temperature': 26.0,
-                    'humidity': 85.0,
-                    'pressure': 1012.0,
-                    'gas_resistance': 50000.0,
-                    'CO2': 430.0,
-                    'VOC': 200.0,
-                    'PM1.0': 4.0,
-                    'PM2.5': 6.0,
-                    'PM10': 8.0
-                },
-                RegionType.FOREST_TEMPERATE: {
-                    'temperature': 18.0,
-                    'humidity': 70.0,
-                    'pressure': 1013.0,
-                    'gas_resistance': 55000.0,
-                    'CO2': 425.0,
-                    'VOC': 150.0,
-                    'PM1.0': 3.0,
-                    'PM2.5': 5.0,
-                    'PM10': 7.0
-                },
-                RegionType.GRASSLAND: {
-                    'temperature': 20.0,
-                    'humidity': 60.0,
-                    'pressure': 1013.0,
-                    'gas_resistance': 50000.0,
-                    'CO2': 420.0,
-                    'VOC': 100.0,
-                    'PM1.0': 4.0,
-                    'PM2.5': 6.0,
-                    'PM10': 9.0
-                },
-                RegionType.DESERT: {
-                    'temperature': 30.0,
-                    'humidity': 20.0,
-                    'pressure': 1012.0,
-                    'gas_resistance': 30000.0,
-                    'CO2': 415.0,
-                    'VOC': 50.0,
-                    'PM1.0': 10.0,
-                    'PM2.5': 25.0,
-                    'PM10': 50.0
-                },
-                RegionType.TUNDRA: {
-                    'temperature': -5.0,
-                    'humidity': 70.0,
-                    'pressure': 1015.0,
-                    'gas_resistance': 70000.0,
-                    'CO2': 410.0,
-                    'VOC': 30.0,
-                    'PM1.0': 2.0,
-                    'PM2.5': 3.0,
-                    'PM10': 4.0
-                },
-                RegionType.URBAN: {
-                    'temperature': 24.0,
-                    'humidity': 65.0,
-                    'pressure': 1012.0,
-                    'gas_resistance': 40000.0,
-                    'CO2': 450.0,
-                    'VOC': 300.0,
-                    'PM1.0': 10.0,
-                    'PM2.5': 20.0,
-                    'PM10': 30.0
-                },
-                RegionType.MOUNTAIN: {
-                    'temperature': 12.0,
-                    'humidity': 60.0,
-                    'pressure': 900.0,
-                    'gas_resistance': 60000.0,
-                    'CO2': 415.0,
-                    'VOC': 80.0,
-                    'PM1.0': 3.0,
-                    'PM2.5': 5.0,
-                    'PM10': 7.0
-                },
-                RegionType.AGRICULTURAL: {
-                    'temperature': 22.0,
-                    'humidity': 65.0,
-                    'pressure': 1013.0,
-                    'gas_resistance': 45000.0,
-                    'CO2': 435.0,
-                    'VOC': 180.0,
-                    'PM1.0': 6.0,
-                    'PM2.5': 12.0,
-                    'PM10': 15.0
-                }
-            }
-            
-            # Calibration factors for urban/rural areas
-            self.calibration_factors = {
-                'urban': {
-                    'CO2': 1.1,
-                    'VOC': 1.2,
-                    'PM': 1.3
-                },
-                'rural': {
-                    'CO2': 1.0,
-                    'VOC': 1.0,
-                    'PM': 1.0
-                }
-            }
-            
-            # Seasonal parameters
-            self.seasonal_params = {
-                'summer': {
-                    'temp_shift': {
-                        RegionType.OCEAN: 2.0,
-                        RegionType.COASTAL: 4.0,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 6.0,
-                        RegionType.GRASSLAND: 8.0,
-                        RegionType.DESERT: 12.0,
-                        RegionType.TUNDRA: 10.0,
-                        RegionType.URBAN: 5.0,
-                        RegionType.MOUNTAIN: 4.0,
-                        RegionType.AGRICULTURAL: 6.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 5.0,
-                        RegionType.COASTAL: 10.0,
-                        RegionType.FOREST_TROPICAL: 5.0,
-                        RegionType.FOREST_TEMPERATE: 15.0,
-                        RegionType.GRASSLAND: -10.0,
-                        RegionType.DESERT: -5.0,
-                        RegionType.TUNDRA: 20.0,
-                        RegionType.URBAN: 5.0,
-                        RegionType.MOUNTAIN: 5.0,
-                        RegionType.AGRICULTURAL: 8.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.1,
-                        RegionType.COASTAL: 1.2,
-                        RegionType.FOREST_TROPICAL: 1.1,
-                        RegionType.FOREST_TEMPERATE: 1.1,
-                        RegionType.GRASSLAND: 1.3,
-                        RegionType.DESERT: 1.5,
-                        RegionType.TUNDRA: 1.0,
-                        RegionType.URBAN: 1.4,
-                        RegionType.MOUNTAIN: 1.1,
-                        RegionType.AGRICULTURAL: 1.3
-                    }
-                },
-                'winter': {
-                    'temp_shift': {
-                        RegionType.OCEAN: -1.0,
-                        RegionType.COASTAL: -3.0,
-                        RegionType.FOREST_TROPICAL: 0.0,
-                        RegionType.FOREST_TEMPERATE: -8.0,
-                        RegionType.GRASSLAND: -10.0,
-                        RegionType.DESERT: -5.0,
-                        RegionType.TUNDRA: -25.0,
-                        RegionType.URBAN: -4.0,
-                        RegionType.MOUNTAIN: -6.0,
-                        RegionType.AGRICULTURAL: -5.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 0.0,
-                        RegionType.COASTAL: 5.0,
-                        RegionType.FOREST_TROPICAL: 0.0,
-                        RegionType.FOREST_TEMPERATE: -5.0,
-                        RegionType.GRASSLAND: -5.0,
-                        RegionType.DESERT: -3.0,
-                        RegionType.TUNDRA: -10.0,
-                        RegionType.URBAN: -5.0,
-                        RegionType.MOUNTAIN: -5.0,
-                        RegionType.AGRICULTURAL: -3.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 1.1,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 1.2,
-                        RegionType.GRASSLAND: 1.4,
-                        RegionType.DESERT: 1.2,
-                        RegionType.TUNDRA: 1.5,
-                        RegionType.URBAN: 1.6,
-                        RegionType.MOUNTAIN: 1.3,
-                        RegionType.AGRICULTURAL: 1.4
-                    }
-                },
-                'spring': {
-                    'temp_shift': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 2.0,
-                        RegionType.FOREST_TROPICAL: 0.5,
-                        RegionType.FOREST_TEMPERATE: 3.0,
-                        RegionType.GRASSLAND: 4.0,
-                        RegionType.DESERT: 6.0,
-                        RegionType.TUNDRA: 5.0,
-                        RegionType.URBAN: 2.0,
-                        RegionType.MOUNTAIN: 2.0,
-                        RegionType.AGRICULTURAL: 3.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 2.0,
-                        RegionType.COASTAL: 8.0,
-                        RegionType.FOREST_TROPICAL: 3.0,
-                        RegionType.FOREST_TEMPERATE: 10.0,
-                        RegionType.GRASSLAND: 5.0,
-                        RegionType.DESERT: 2.0,
-                        RegionType.TUNDRA: 15.0,
-                        RegionType.URBAN: 3.0,
-                        RegionType.MOUNTAIN: 3.0,
-                        RegionType.AGRICULTURAL: 5.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 1.1,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 1.1,
-                        RegionType.GRASSLAND: 1.2,
-                        RegionType.DESERT: 1.3,
-                        RegionType.TUNDRA: 1.1,
-                        RegionType.URBAN: 1.3,
-                        RegionType.MOUNTAIN: 1.1,
-                        RegionType.AGRICULTURAL: 1.2
-                    }
-                },
-                'fall': {
-                    'temp_shift': {
-                        RegionType.OCEAN: 0.5,
-                        RegionType.COASTAL: 1.0,
-                        RegionType.FOREST_TROPICAL: 0.5,
-                        RegionType.FOREST_TEMPERATE: 2.0,
-                        RegionType.GRASSLAND: 3.0,
-                        RegionType.DESERT: 4.0,
-                        RegionType.TUNDRA: 2.0,
-                        RegionType.URBAN: 1.0,
-                        RegionType.MOUNTAIN: 1.0,
-                        RegionType.AGRICULTURAL: 2.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 5.0,
-                        RegionType.FOREST_TROPICAL: 2.0,
-                        RegionType.FOREST_TEMPERATE: 8.0,
-                        RegionType.GRASSLAND: 3.0,
-                        RegionType.DESERT: 1.0,
-                        RegionType.TUNDRA: 10.0,
-                        RegionType.URBAN: 2.0,
-                        RegionType.MOUNTAIN: 2.0,
-                        RegionType.AGRICULTURAL: 3.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 1.1,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 1.2,
-                        RegionType.GRASSLAND: 1.3,
-                        RegionType.DESERT: 1.4,
-                        RegionType.TUNDRA: 1.2,
-                        RegionType.URBAN: 1.4,
-                        RegionType.MOUNTAIN: 1.2,
-                        RegionType.AGRICULTURAL: 1.3
-                    }
-                }
-            }
-            
-            # Diurnal parameters
-            self.diurnal_params = {
-                'morning': {
-                    'temp_shift': {
-                        RegionType.OCEAN: -0.5,
-                        RegionType.COASTAL: -1.0,
-                        RegionType.FOREST_TROPICAL: -0.5,
-                        RegionType.FOREST_TEMPERATE: -1.5,
-                        RegionType.GRASSLAND: -2.0,
-                        RegionType.DESERT: -3.0,
-                        RegionType.TUNDRA: -1.0,
-                        RegionType.URBAN: -1.0,
-                        RegionType.MOUNTAIN: -1.5,
-                        RegionType.AGRICULTURAL: -1.5
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 5.0,
-                        RegionType.COASTAL: 10.0,
-                        RegionType.FOREST_TROPICAL: 5.0,
-                        RegionType.FOREST_TEMPERATE: 10.0,
-                        RegionType.GRASSLAND: 15.0,
-                        RegionType.DESERT: 10.0,
-                        RegionType.TUNDRA: 5.0,
-                        RegionType.URBAN: 8.0,
-                        RegionType.MOUNTAIN: 10.0,
-                        RegionType.AGRICULTURAL: 12.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 1.1,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 1.1,
-                        RegionType.GRASSLAND: 1.2,
-                        RegionType.DESERT: 1.3,
-                        RegionType.TUNDRA: 1.0,
-                        RegionType.URBAN: 1.3,
-                        RegionType.MOUNTAIN: 1.1,
-                        RegionType.AGRICULTURAL: 1.2
-                    }
-                },
-                'afternoon': {
-                    'temp_shift': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 3.0,
-                        RegionType.FOREST_TROPICAL: 2.0,
-                        RegionType.FOREST_TEMPERATE: 4.0,
-                        RegionType.GRASSLAND: 6.0,
-                        RegionType.DESERT: 10.0,
-                        RegionType.TUNDRA: 3.0,
-                        RegionType.URBAN: 4.0,
-                        RegionType.MOUNTAIN: 3.0,
-                        RegionType.AGRICULTURAL: 5.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: -5.0,
-                        RegionType.COASTAL: -10.0,
-                        RegionType.FOREST_TROPICAL: -5.0,
-                        RegionType.FOREST_TEMPERATE: -10.0,
-                        RegionType.GRASSLAND: -15.0,
-                        RegionType.DESERT: -5.0,
-                        RegionType.TUNDRA: -5.0,
-                        RegionType.URBAN: -10.0,
-                        RegionType.MOUNTAIN: -10.0,
-                        RegionType.AGRICULTURAL: -12.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.0,
-                        RegionType.COASTAL: 1.0,
-                        RegionType.FOREST_TROPICAL: 1.0,
-                        RegionType.FOREST_TEMPERATE: 1.0,
-                        RegionType.GRASSLAND: 1.1,
-                        RegionType.DESERT: 1.2,
-                        RegionType.TUNDRA: 1.0,
-                        RegionType.URBAN: 1.2,
-                        RegionType.MOUNTAIN: 1.0,
-                        RegionType.AGRICULTURAL: 1.1
-                    }
-                },
-                'evening': {
-                    'temp_shift': {
-                        RegionType.OCEAN: 0.5,
-                        RegionType.COASTAL: 1.0,
-                        RegionType.FOREST_TROPICAL: 0.5,
-                        RegionType.FOREST_TEMPERATE: 1.0,
-                        RegionType.GRASSLAND: 2.0,
-                        RegionType.DESERT: 3.0,
-                        RegionType.TUNDRA: 1.0,
-                        RegionType.URBAN: 1.0,
-                        RegionType.MOUNTAIN: 1.0,
-                        RegionType.AGRICULTURAL: 1.5
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 3.0,
-                        RegionType.COASTAL: 8.0,
-                        RegionType.FOREST_TROPICAL: 3.0,
-                        RegionType.FOREST_TEMPERATE: 8.0,
-                        RegionType.GRASSLAND: 10.0,
-                        RegionType.DESERT: 5.0,
-                        RegionType.TUNDRA: 3.0,
-                        RegionType.URBAN: 5.0,
-                        RegionType.MOUNTAIN: 5.0,
-                        RegionType.AGRICULTURAL: 8.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 1.1,
-                        RegionType.COASTAL: 1.2,
-                        RegionType.FOREST_TROPICAL: 1.1,
-                        RegionType.FOREST_TEMPERATE: 1.2,
-                        RegionType.GRASSLAND: 1.3,
-                        RegionType.DESERT: 1.4,
-                        RegionType.TUNDRA: 1.1,
-                        RegionType.URBAN: 1.4,
-                        RegionType.MOUNTAIN: 1.2,
-                        RegionType.AGRICULTURAL: 1.3
-                    }
-                },
-                'night': {
-                    'temp_shift': {
-                        RegionType.OCEAN: -1.0,
-                        RegionType.COASTAL: -2.0,
-                        RegionType.FOREST_TROPICAL: -1.0,
-                        RegionType.FOREST_TEMPERATE: -3.0,
-                        RegionType.GRASSLAND: -4.0,
-                        RegionType.DESERT: -8.0,
-                        RegionType.TUNDRA: -2.0,
-                        RegionType.URBAN: -2.0,
-                        RegionType.MOUNTAIN: -3.0,
-                        RegionType.AGRICULTURAL: -3.0
-                    },
-                    'humidity_shift': {
-                        RegionType.OCEAN: 8.0,
-                        RegionType.COASTAL: 15.0,
-                        RegionType.FOREST_TROPICAL: 8.0,
-                        RegionType.FOREST_TEMPERATE: 15.0,
-                        RegionType.GRASSLAND: 20.0,
-                        RegionType.DESERT: 15.0,
-                        RegionType.TUNDRA: 10.0,
-                        RegionType.URBAN: 12.0,
-                        RegionType.MOUNTAIN: 15.0,
-                        RegionType.AGRICULTURAL: 18.0
-                    },
-                    'pollution_factor': {
-                        RegionType.OCEAN: 0.9,
-                        RegionType.COASTAL: 0.9,
-                        RegionType.FOREST_TROPICAL: 0.9,
-                        RegionType.FOREST_TEMPERATE: 0.9,
-                        RegionType.GRASSLAND: 0.9,
-                        RegionType.DESERT: 0.8,
-                        RegionType.TUNDRA: 0.9,
-                        RegionType.URBAN: 1.0,
-                        RegionType.MOUNTAIN: 0.9,
-                        RegionType.AGRICULTURAL: 0.9
-                    }
-                }
-            }
-            
-            # Load elevation data (simplified for demo)
-            self.elevation_data = self._load_elevation_data()
+            _import_tensorflow()
+
+            # Model loading and tracing are noisy; silence warnings only around them
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                # Prefer the SavedModel exported next to the .keras file, which restores the
+                # compiled forward pass without rebuilding the Keras layers; otherwise load
+                # the Keras model and export it
+                self.model = None
+                self._saved_model_dir = os.path.splitext(model_path.rstrip(os.sep))[0] + '_savedmodel'
+                self._inference_module = self._load_saved_model(model_path)
+                if self._inference_module is None:
+                    self.model = tf.keras.models.load_model(
+                        model_path,
+                        custom_objects={},
+                        compile=False
+                    )
+                    self._inference_module = self._build_inference_module()
+                    self._export_saved_model()
+                    # Serve from the fresh export like every later start, which also
+                    # lets the Keras layer objects be released
+                    exported = self._load_saved_model(model_path)
+                    if exported is not None:
+                        self._inference_module = exported
+                        self.model = None
+
+                self._infer = self._inference_module.infer.get_concrete_function(
+                    tf.TensorSpec([None, 3, 128, 128, 1], tf.float32)
+                )
+                self._validate_model(validate)
+
+            # Lookup tables derived from the class-level parameters, shared by all instances
+            self._build_tables()
+
+            # Per-thread scratch buffers reused by the single-location helpers
+            self._thread_local = threading.local()
+
+            # Sensor noise source when numba is unavailable (the fused kernel draws from
+            # numba's own per-thread generator, which is already fork-safe); Generator
+            # draws are thread-safe. Processes forked after construction would inherit
+            # the same generator state, so each child reseeds it.
+            self._rng = np.random.default_rng()
+            if hasattr(os, 'register_at_fork'):
+                os.register_at_fork(after_in_child=partial(_reseed_after_fork, weakref.ref(self)))
+
+            # Optional quantized TFLite model; interpreters are created per thread
+            self._tflite_model = self._maybe_convert_tflite(model_path) if quantize else None
+            self._tflite_local = threading.local()
             
         except FileNotFoundError:
             raise RuntimeError(f"Model file not found at {model_path}")
         except Exception as e:
             raise RuntimeError(f"Initialization failed: {str(e)}")
 
-    def _load_elevation_data(self) -> Dict:
-        """Load simplified elevation data."""
-        return {
-            'default': 0.0,
-            'mountain_threshold': 1000.0  # meters
-        }
+    @staticmethod
+    def _params_to_arrays(params: Dict, periods: Tuple[str, ...]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert {period: {parameter: {region: value}}} tables into (period, region) arrays."""
+        return tuple(
+            np.array([[params[period][name][region] for region in RegionType] for period in periods])
+            for name in ('temp_shift', 'humidity_shift', 'pollution_factor')
+        )
+
+    @classmethod
+    def _build_tables(cls):
+        """Build the lookup tables derived from the class-level parameters, once per process."""
+        with cls._tables_lock:
+            if cls._tables_built:
+                return
+            # Base value vectors (ordered as VARIABLES) indexed by RegionType value
+            cls._base_values = np.zeros((len(RegionType), len(VARIABLES)), dtype=np.float32)
+            for region, values in cls.regional_base_values.items():
+                cls._base_values[region] = [values[name] for name in VARIABLES]
 
-    def _validate_model(self):
-        """Validate the loaded model architecture and weights."""
+            # Combined seasonal + diurnal adjustments as (season, time of day, region)
+            # arrays for the hot path; the region axis is indexed by RegionType value
+            season_temp, season_humidity, season_pollution = cls._params_to_arrays(cls.seasonal_params, _SEASONS)
+            diurnal_temp, diurnal_humidity, diurnal_pollution = cls._params_to_arrays(cls.diurnal_params, _TIMES_OF_DAY)
+            cls._temp_shift = season_temp[:, None, :] + diurnal_temp[None, :, :]
+            cls._humidity_shift = season_humidity[:, None, :] + diurnal_humidity[None, :, :]
+            cls._pollution_factor = season_pollution[:, None, :] * diurnal_pollution[None, :, :]
+
+            # Region type of every MERRA-2 cell, so per-prediction lookups are a
+            # table index instead of the full classifier, and elevation per region
+            cls._region_grid = cls._build_region_grid()
+            cls._region_elevations = np.zeros(len(RegionType))
+            for region in RegionType:
+                cls._region_elevations[region] = cls._region_elevation(region)
+
+            # Pollutant calibration multipliers for readings ordered as _OUTPUT_FIELDS,
+            # indexed by RegionType value; only urban cells use the urban factors
+            cls._calibration = np.ones((len(RegionType), len(_OUTPUT_FIELDS)))
+            for region in RegionType:
+                factors = cls.calibration_factors['urban' if region == RegionType.URBAN else 'rural']
+                cls._calibration[region, 5:] = [factors['CO2'], factors['VOC'],
+                                                factors['PM'], factors['PM'], factors['PM']]
+
+            # Input-independent patch geometry: normalized distance from the patch
+            # centre and the base spatial pattern of each region family (ocean,
+            # desert, urban, everything else), stacked so batches can gather them
+            x = np.linspace(-1, 1, 128)
+            rel_lat, rel_lon = np.meshgrid(x, x)
+            dist = np.sqrt(rel_lat**2 + rel_lon**2) / np.sqrt(2)
+            cls._patterns = np.stack([
+                0.3 + 0.7 * np.exp(-dist * 3),
+                0.5 + 0.5 * np.sin(dist * 10),
+                0.4 + 0.6 * (1 - dist**2),
+                np.maximum(0.2, np.exp(-dist * 2))
+            ]).astype(np.float32)
+            # Pattern row and seasonal/diurnal modulation gains, indexed by RegionType value
+            cls._pattern_index = np.full(len(RegionType), 3, dtype=np.intp)
+            cls._seasonal_gain = np.ones(len(RegionType))
+            cls._diurnal_gain = np.ones(len(RegionType))
+            for row, region, seasonal_gain, diurnal_gain in [(0, RegionType.OCEAN, 0.7, 0.5),
+                                                             (1, RegionType.DESERT, 1.2, 1.5),
+                                                             (2, RegionType.URBAN, 0.9, 1.2)]:
+                cls._pattern_index[region] = row
+                cls._seasonal_gain[region] = seasonal_gain
+                cls._diurnal_gain[region] = diurnal_gain
+
+            cls._tables_built = True
+
+    def _build_inference_module(self) -> 'tf.Module':
+        """Wrap the Keras forward pass in an XLA-compiled tf.function on a saveable module."""
+        module = tf.Module()
+        module.model = self.model
+        module.infer = tf.function(
+            lambda x: module.model(x, training=False),
+            jit_compile=True,
+            input_signature=[tf.TensorSpec([None, 3, 128, 128, 1], tf.float32)]
+        )
+        return module
+
+    def _load_saved_model(self, model_path: str):
+        """Load the exported SavedModel if it is up to date with model_path, else return None."""
+        if not _cache_is_fresh(self._saved_model_dir, model_path):
+            return None
         try:
+            return tf.saved_model.load(self._saved_model_dir)
+        except Exception:
+            return None  # unreadable export; fall back to the Keras model
+
+    def _export_saved_model(self):
+        """Export the inference module as a SavedModel next to the Keras model (best effort)."""
+        tmp_dir = f"{self._saved_model_dir}.{os.getpid()}.tmp"
+        try:
+            tf.saved_model.save(self._inference_module, tmp_dir,
+                                signatures={'serve': self._inference_module.infer.get_concrete_function()})
+            # Swap the finished export in so concurrent processes never load a partial one
+            shutil.rmtree(self._saved_model_dir, ignore_errors=True)
+            os.replace(tmp_dir, self._saved_model_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)  # e.g. read-only model directory
+
+    def _maybe_convert_tflite(self, model_path: str) -> bytes:
+        """
+        Return the INT8 TFLite flatbuffer for a model, converting it only when the
+        copy cached next to the model file is missing or older than the model.
+
+        Args:
+            model_path: Path the Keras model was loaded from
+
+        Returns:
+            The TFLite flatbuffer bytes
+        """
+        tflite_path = os.path.splitext(model_path.rstrip(os.sep))[0] + '.int8.tflite'
+        if _cache_is_fresh(tflite_path, model_path):
+            with open(tflite_path, 'rb') as f:
+                return f.read()
+        tflite_model = self._convert_to_tflite()
+        try:
+            # Write then rename so concurrent processes never read a partial file
+            tmp_path = f"{tflite_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(tflite_model)
+            os.replace(tmp_path, tflite_path)
+        except OSError:
+            pass  # read-only model directory; convert again on next start
+        return tflite_model
+
+    def _convert_to_tflite(self) -> bytes:
+        """Convert the model to an INT8-quantized TFLite flatbuffer."""
+        rng = np.random.default_rng(0)
+
+        def representative_dataset():
+            for _ in range(100):
+                lat = rng.uniform(self.lat_min, self.lat_max)
+                lon = rng.uniform(self.lon_min, self.lon_max)
+                dt = datetime(2024, 1, 1) + relativedelta(days=int(rng.integers(366)), hours=int(rng.integers(24)))
+                patch = self._generate_synthetic_patch(lat, lon, dt)
+                yield [patch[np.newaxis, ...].astype(np.float32)]
+
+        if self.model is not None:
+            converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        else:
+            converter = tf.lite.TFLiteConverter.from_saved_model(self._saved_model_dir, signature_keys=['serve'])
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        return converter.convert()
+
+    def _tflite_interpreter(self):
+        """Return this thread's TFLite interpreter, creating it on first use."""
+        interpreter = getattr(self._tflite_local, 'interpreter', None)
+        if interpreter is None:
+            interpreter = tf.lite.Interpreter(model_content=self._tflite_model, num_threads=1)
+            interpreter.allocate_tensors()
+            self._tflite_local.interpreter = interpreter
+        return interpreter
+
+    def _run_model(self, inputs: np.ndarray) -> np.ndarray:
+        """Run the model on a float32 batch of shape (N, 3, 128, 128, 1)."""
+        if self._tflite_model is None:
+            return self._infer(tf.constant(inputs, dtype=tf.float32)).numpy()
+        interpreter = self._tflite_interpreter()
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        if tuple(input_details['shape']) != inputs.shape:
+            interpreter.resize_tensor_input(input_details['index'], inputs.shape)
+            interpreter.allocate_tensors()
+        # Models with integer I/O expect quantized inputs and return quantized outputs
+        input_scale, input_zero_point = input_details['quantization']
+        if input_scale:
+            limits = np.iinfo(input_details['dtype'])
+            # One float32 temporary, rounded and clipped in place, instead of one per step
+            inputs = np.divide(inputs, np.float32(input_scale), dtype=np.float32)
+            inputs += np.float32(input_zero_point)
+            np.clip(np.round(inputs, out=inputs), limits.min, limits.max, out=inputs)
+        interpreter.set_tensor(input_details['index'], np.ascontiguousarray(inputs, dtype=input_details['dtype']))
+        interpreter.invoke()
+        outputs = interpreter.get_tensor(output_details['index'])
+        output_scale, output_zero_point = output_details['quantization']
+        if output_scale:
+            outputs = (outputs.astype(np.float32) - output_zero_point) * output_scale
+        return outputs
+
+    def _validate_model(self, run_inference: bool = False):
+        """
+        Validate the loaded model architecture and, optionally, its weights.
+
+        Args:
+            run_inference: Also run a random test input through the model rather than
+                only checking the traced output shape
+        """
+        try:
+            output_shape = tuple(self._infer.structured_outputs.shape.as_list())
+            if output_shape != (None, 128, 128, 2):
+                raise ValueError("Model output shape mismatch")
+            if not run_inference:
+                return
             test_input = np.random.rand(1, 3, 128, 128, 1).astype(np.float32)
-            test_output = self.model.predict(test_input, verbose=0)
+            test_output = self._infer(tf.constant(test_input)).numpy()
             if test_output.shape != (1, 128, 128, 2):
                 raise ValueError("Model output shape mismatch")
         except Exception as e:
             raise ValueError(f"Model validation failed: {str(e)}")
 
+    @classmethod
+    def _build_region_grid(cls) -> np.ndarray:
+        """Classify the centre of every MERRA-2 cell into a (lat_idx, lon_idx) uint8 grid of RegionType values."""
+        n_lat = int(round((cls.lat_max - cls.lat_min) / cls.lat_res))
+        n_lon = int(round((cls.lon_max - cls.lon_min) / cls.lon_res))
+        lat_centers = cls.lat_max - (np.arange(n_lat) + 0.5) * cls.lat_res
+        lon_centers = cls.lon_min + (np.arange(n_lon) + 0.5) * cls.lon_res
+        lat_grid, lon_grid = np.meshgrid(lat_centers, lon_centers, indexing='ij')
+        lats, lons = lat_grid.ravel(), lon_grid.ravel()
+        regions = np.empty(lats.shape, dtype=np.uint8)
+        _classify_regions(lats, lons, regions)
+        urban = np.isin(regions, (_GRASSLAND, _AGRICULTURAL)) & _near_major_city(lats, lons)
+        regions[urban] = _URBAN
+        return regions.reshape(n_lat, n_lon)
+
+    def merra_cells(self, lats: np.ndarray, lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up the MERRA-2 grid cells containing many locations.
+
+        Locations sharing a cell and a datetime get the same prediction.
+
+        Args:
+            lats: Array of latitudes in degrees
+            lons: Array of longitudes in degrees
+
+        Returns:
+            (lat_idx, lon_idx) arrays of grid indices, as _latlon_to_merra_index gives for one location
+        """
+        n_lat, n_lon = self._region_grid.shape
+        lats = np.clip(lats, self.lat_min, self.lat_max)
+        lons = np.clip(lons, self.lon_min, self.lon_max)
+        lat_idx = np.minimum(((self.lat_max - lats) / self.lat_res).astype(np.intp), n_lat - 1)
+        lon_idx = np.minimum(((lons - self.lon_min) / self.lon_res).astype(np.intp), n_lon - 1)
+        return lat_idx, lon_idx
+
+    def _region_values(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Vectorized lookup of the RegionType values for arrays of locations."""
+        return self._region_grid[self.merra_cells(lats, lons)].astype(np.intp)
+
     def _determine_region_type(self, lat: float, lon: float) -> RegionType:
-        """Determine the region type based on latitude and longitude."""
-        if (abs(lat) < 30 and ((0 < lon < 20) or (60 < lon < 100) or (140 < lon < 180) or 
-            (-140 < lon < -60) or (-20 < lon < 0))):
-            return RegionType.OCEAN
-        if ((15 < lat < 35 and -120 < lon < -80) or
-            (15 < lat < 30 and -10 < lon < 50) or
-            (20 < lat < 35 and 50 < lon < 80) or
-            (-30 < lat < -15 and 115 < lon < 150) or
-            (-30 < lat < -15 and -80 < lon < -60)):
-            return RegionType.DESERT
-        if ((-10 < lat < 10 and -80 < lon < -50) or
-            (-10 < lat < 10 and 10 < lon < 40) or
-            (-10 < lat < 10 and 90 < lon < 150)):
-            return RegionType.FOREST_TROPICAL
-        if (((40 < lat < 60 and -10 < lon < 30) or
-             (40 < lat < 60 and -130 < lon < -70) or
-             (30 < lat < 50 and 120 < lon < 150))):
-            return RegionType.FOREST_TEMPERATE
-        if (lat > 60 or lat < -60):
-            return RegionType.TUNDRA
-        if ((35 < lat < 45 and -120 < lon < -105) or
-            (-35 < lat < -20 and -75 < lon < -60) or
-            (30 < lat < 40 and 70 < lon < 90) or
-            (45 < lat < 50 and 5 < lon < 15)):
-            return RegionType.MOUNTAIN
-        if (abs(lon) < 10 or abs(lon) > 170 or 
-            (abs(lat) < 30 and (abs(lon) < 100 and abs(lon) > 80))):
-            return RegionType.COASTAL
-        major_cities = [
-            (40.7, -74.0), (51.5, -0.1), (35.7, 139.7), (19.1, 72.9),
-            (34.1, -118.2), (41.9, 12.5), (-23.5, -46.6), (30.0, 31.2),
-            (39.9, 116.4), (55.8, 37.6)
-        ]
-        for city_lat, city_lon in major_cities:
-            if abs(lat - city_lat) < 1.0 and abs(lon - city_lon) < 1.5:
-                return RegionType.URBAN
-        if ((25 < lat < 50 and -105 < lon < -75) or
-            (45 < lat < 55 and -5 < lon < 30) or
-            (-40 < lat < -20 and -65 < lon < -50) or
-            (20 < lat < 40 and 70 < lon < 100)):
-            return RegionType.AGRICULTURAL
-        return RegionType.GRASSLAND
-
-    def _get_elevation(self, lat: float, lon: float) -> float:
-        """Get elevation for a given location (simplified)."""
-        region = self._determine_region_type(lat, lon)
+        """Look up the region type of the MERRA-2 cell containing a location."""
+        return _REGION_TYPES[self._region_grid[self._latlon_to_merra_index(lat, lon)]]
+
+    @staticmethod
+    def _region_elevation(region: RegionType) -> float:
+        """Representative elevation in meters for a region type."""
         if region == RegionType.MOUNTAIN:
             return 2500.0
         elif region == RegionType.TUNDRA:
@@ -574,168 +1167,234 @@ class HighAccuracyEnvironmentalPredictor:
 
     def _latlon_to_merra_index(self, lat: float, lon: float) -> Tuple[int, int]:
         """Convert lat/lon to MERRA-2 grid indices with boundary checks."""
-        lat = max(min(lat, self.lat_max), self.lat_min)
-        lon = max(min(lon, self.lon_max), self.lon_min)
-        lat_idx = int((self.lat_max - lat) / self.lat_res)
-        lon_idx = int((lon - self.lon_min) / self.lon_res)
-        return lat_idx, lon_idx
+        n_lat, n_lon = self._region_grid.shape
+        return _merra_index(float(lat), float(lon), self.lat_min, self.lat_max, self.lon_min, self.lon_max,
+                            self.lat_res, self.lon_res, n_lat, n_lon)
 
     def _datetime_to_features(self, dt: datetime) -> Dict:
-        """Convert datetime to comprehensive temporal features."""
-        year_progress = (dt.timetuple().tm_yday - 1) / 365.0
-        seasonal_sin = math.sin(2 * math.pi * year_progress)
-        seasonal_cos = math.cos(2 * math.pi * year_progress)
-        diurnal_progress = (dt.hour * 60 + dt.minute) / (24 * 60)
-        diurnal_sin = math.sin(2 * math.pi * diurnal_progress)
-        diurnal_cos = math.cos(2 * math.pi * diurnal_progress)
-        month = dt.month
-        if 3 <= month <= 5:
-            season = 'spring'
-        elif 6 <= month <= 8:
-            season = 'summer'
-        elif 9 <= month <= 11:
-            season = 'fall'
-        else:
-            season = 'winter'
-        hour = dt.hour
-        if 5 <= hour < 11:
-            time_of_day = 'morning'
-        elif 11 <= hour < 16:
-            time_of_day = 'afternoon'
-        elif 16 <= hour < 21:
-            time_of_day = 'evening'
-        else:
-            time_of_day = 'night'
-        return {
-            'year_progress': year_progress,
-            'seasonal_sin': seasonal_sin,
-            'seasonal_cos': seasonal_cos,
-            'diurnal_sin': diurnal_sin,
-            'diurnal_cos': diurnal_cos,
-            'season': season,
-            'time_of_day': time_of_day,
-            'hour': hour,
-            'month': month
-        }
+        """
+        Convert datetime to comprehensive temporal features.
+
+        The dict is memoized per datetime and shared between calls; treat it as read-only.
+        """
+        return _temporal_features(dt)
+
+    def _thread_buffer(self, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """Return this thread's named scratch buffer, creating it on first use."""
+        buffer = getattr(self._thread_local, name, None)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+            setattr(self._thread_local, name, buffer)
+        return buffer
 
     def _generate_synthetic_patch(self, lat: float, lon: float, dt: datetime) -> np.ndarray:
-        """Generate enhanced synthetic data patch with realistic regional patterns."""
-        region_type = self._determine_region_type(lat, lon)
+        """
+        Generate enhanced synthetic data patch with realistic regional patterns.
+
+        The returned array is a per-thread buffer that the next call on the same
+        thread overwrites; copy it if it needs to outlive that call.
+        """
+        sequence = self._thread_buffer('patch', (3, 128, 128, 1), np.float32)
+        region = self._region_grid[self._latlon_to_merra_index(lat, lon)]
+        self._fill_region_patches(np.array([region], dtype=np.intp), dt, sequence[np.newaxis])
+        return sequence
+
+    def _generate_synthetic_patch_batch(self, lats: np.ndarray, lons: np.ndarray, dt: datetime,
+                                        out: np.ndarray = None) -> np.ndarray:
+        """
+        Generate synthetic data patches for many locations at once.
+
+        Args:
+            lats: Array of latitudes in degrees
+            lons: Array of longitudes in degrees
+            dt: Date and time shared by all locations
+            out: Optional float32 array of shape (N, 3, 128, 128, 1) to fill
+
+        Returns:
+            Float32 array of shape (N, 3, 128, 128, 1)
+        """
+        regions = self._region_values(lats, lons)
+        if out is None:
+            out = np.empty((len(regions), 3, 128, 128, 1), dtype=np.float32)
+        return self._fill_region_patches(regions, dt, out)
+
+    def _fill_region_patches(self, regions: np.ndarray, dt: datetime, out: np.ndarray) -> np.ndarray:
+        """Fill the float32 (N, 3, 128, 128, 1) out with the patches of N RegionType values at one datetime."""
         temporal_features = self._datetime_to_features(dt)
-        elevation = self._get_elevation(lat, lon)
-        x = np.linspace(-1, 1, 128)
-        y = np.linspace(-1, 1, 128)
-        rel_lat, rel_lon = np.meshgrid(x, y)
-        dist = np.sqrt(rel_lat**2 + rel_lon**2) / np.sqrt(2)
-        if region_type == RegionType.OCEAN:
-            pattern = 0.3 + 0.7 * np.exp(-dist * 3)
-        elif region_type == RegionType.DESERT:
-            pattern = 0.5 + 0.5 * np.sin(dist * 10)
-        elif region_type == RegionType.URBAN:
-            pattern = 0.4 + 0.6 * (1 - dist**2)
-        else:
-            pattern = np.maximum(0.2, np.exp(-dist * 2))
-        seasonal_effect = 0.5 * temporal_features['seasonal_sin'] + 0.2 * temporal_features['seasonal_cos']
-        diurnal_effect = 0.3 * temporal_features['diurnal_sin'] + 0.1 * temporal_features['diurnal_cos']
-        if region_type == RegionType.OCEAN:
-            seasonal_effect *= 0.7
-            diurnal_effect *= 0.5
-        elif region_type == RegionType.DESERT:
-            seasonal_effect *= 1.2
-            diurnal_effect *= 1.5
-        elif region_type == RegionType.URBAN:
-            seasonal_effect *= 0.9
-            diurnal_effect *= 1.2
-        patch = np.clip(pattern * (1 + seasonal_effect) * (1 + diurnal_effect * 0.5), 0.1, 1.0)
-        elevation_factor = 1.0 - min(1.0, elevation / 5000.0)
-        patch *= elevation_factor
-        sequence = np.stack([
-            patch * 0.85,
-            patch * 0.93,
-            patch
-        ], axis=0)
-        return sequence[..., np.newaxis]
-
-    def _apply_temporal_adjustments(self, base_values: Dict, dt: datetime, region_type: RegionType) -> Dict:
-        """Apply enhanced seasonal and diurnal adjustments with regional variations."""
+        seasonal_term = 0.5 * temporal_features['seasonal_sin'] + 0.2 * temporal_features['seasonal_cos']
+        diurnal_term = 0.3 * temporal_features['diurnal_sin'] + 0.1 * temporal_features['diurnal_cos']
+        if NUMBA_AVAILABLE:
+            _fill_patches(self._patterns, regions, self._pattern_index, self._seasonal_gain, self._diurnal_gain,
+                          self._region_elevations, seasonal_term, diurnal_term, out)
+            return out
+        scale = ((1 + seasonal_term * self._seasonal_gain[regions]) *
+                 (1 + diurnal_term * self._diurnal_gain[regions] * 0.5)).astype(np.float32)
+        elevation_factor = (1.0 - np.minimum(1.0, self._region_elevations[regions] / 5000.0)).astype(np.float32)
+        patches = out[:, 2, ..., 0]
+        # Gather straight into the float32 output (mode='clip' avoids take's
+        # internal buffer) and scale in place, so no float64 or temporary
+        # (N, 128, 128) arrays are created
+        np.take(self._patterns, self._pattern_index[regions], axis=0, out=patches, mode='clip')
+        patches *= scale[:, None, None]
+        np.clip(patches, np.float32(0.1), np.float32(1.0), out=patches)
+        patches *= elevation_factor[:, None, None]
+        np.multiply(patches, np.float32(0.85), out=out[:, 0, ..., 0])
+        np.multiply(patches, np.float32(0.93), out=out[:, 1, ..., 0])
+        return out
+
+    def _batch_activity(self, lats: np.ndarray, lons: np.ndarray, datetimes: List[datetime],
+                        group_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the model over many locations in chunks of at most _MAX_MODEL_BATCH.
+
+        Args:
+            lats: Array of N latitudes in degrees
+            lons: Array of N longitudes in degrees
+            datetimes: The distinct prediction datetimes
+            group_ids: Index into datetimes for each location
+
+        Returns:
+            (normalized_activity, uncertainty) float64 arrays of N values each
+        """
+        activity = np.empty(len(lats))
+        uncertainty = np.empty(len(lats))
+        patches = np.empty((min(len(lats), _MAX_MODEL_BATCH), 3, 128, 128, 1), dtype=np.float32)
+        for start in range(0, len(lats), _MAX_MODEL_BATCH):
+            stop = min(start + _MAX_MODEL_BATCH, len(lats))
+            chunk = patches[:stop - start]
+            chunk_groups = group_ids[start:stop]
+            for group_id in np.unique(chunk_groups):
+                rows = np.flatnonzero(chunk_groups == group_id)
+                if len(rows) == len(chunk):
+                    self._generate_synthetic_patch_batch(lats[start:stop], lons[start:stop], datetimes[group_id],
+                                                         out=chunk)
+                else:
+                    chunk[rows] = self._generate_synthetic_patch_batch(lats[start + rows], lons[start + rows],
+                                                                       datetimes[group_id])
+            activity[start:stop], uncertainty[start:stop] = self._summarize_predictions(self._run_model(chunk))
+        return activity, uncertainty
+
+    def _summarize_predictions(self, preds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce model outputs to per-sample activity and uncertainty.
+
+        Args:
+            preds: Model outputs of shape (N, 128, 128, 2)
+
+        Returns:
+            (normalized_activity, uncertainty) float64 arrays of N values each
+        """
+        activity = np.empty(len(preds))
+        uncertainty = np.empty(len(preds))
+        if NUMBA_AVAILABLE:
+            _summarize_outputs(preds, activity, uncertainty)
+            return activity, uncertainty
+        mean_preds = preds[..., 0]
+        pred_min = mean_preds.min(axis=(1, 2))
+        pred_range = mean_preds.max(axis=(1, 2)) - pred_min
+        activity[:] = (mean_preds.mean(axis=(1, 2)) - pred_min) / (pred_range + _RANGE_EPSILON)
+        uncertainty[:] = preds[..., 1].mean(axis=(1, 2))
+        return activity, uncertainty
+
+    def _apply_temporal_adjustments_batch(self, base_values: np.ndarray, dt: datetime,
+                                          regions: np.ndarray) -> np.ndarray:
+        """
+        Apply seasonal and diurnal adjustments with regional variations to many locations
+        sharing one date and time; the NumPy counterpart of _adjust_row.
+
+        Args:
+            base_values: Array of shape (N, 9) with columns ordered as VARIABLES
+            dt: Date and time shared by all locations
+            regions: Array of N RegionType values
+
+        Returns:
+            Adjusted float64 array of shape (N, 9)
+        """
         temporal_features = self._datetime_to_features(dt)
-        season = temporal_features['season']
-        time_of_day = temporal_features['time_of_day']
-        season_params = self.seasonal_params.get(season, {})
-        diurnal_params = self.diurnal_params.get(time_of_day, {})
-        adjusted_values = base_values.copy()
-        temp_shift = (season_params.get('temp_shift', {}).get(region_type, 0.0) +
-                     diurnal_params.get('temp_shift', {}).get(region_type, 0.0))
-        adjusted_values['temperature'] += temp_shift * (1 + 0.1 * temporal_features['seasonal_sin'])
-        humidity_shift = (season_params.get('humidity_shift', {}).get(region_type, 0.0) +
-                        diurnal_params.get('humidity_shift', {}).get(region_type, 0.0))
-        adjusted_values['humidity'] = min(100, max(10, adjusted_values['humidity'] + humidity_shift))
-        season_pollution = season_params.get('pollution_factor', {}).get(region_type, 1.0)
-        diurnal_pollution = diurnal_params.get('pollution_factor', {}).get(region_type, 1.0)
-        pollution_factor = season_pollution * diurnal_pollution
-        adjusted_values['CO2'] *= pollution_factor
-        adjusted_values['VOC'] *= pollution_factor * (1.2 if region_type == RegionType.URBAN else 1.1)
-        adjusted_values['PM1.0'] *= pollution_factor
-        adjusted_values['PM2.5'] *= pollution_factor * (1.3 if region_type == RegionType.URBAN else 1.2)
-        adjusted_values['PM10'] *= pollution_factor * (1.4 if region_type == RegionType.URBAN else 1.2)
+        season_idx = temporal_features['season_idx']
+        time_of_day_idx = temporal_features['time_of_day_idx']
+        temp_gain = 1 + 0.1 * temporal_features['seasonal_sin']
+        adjusted_values = np.array(base_values, dtype=np.float64)
+        temp_shift = self._temp_shift[season_idx, time_of_day_idx, regions]
+        adjusted_values[:, _TEMPERATURE] += temp_shift * temp_gain
+        humidity_shift = self._humidity_shift[season_idx, time_of_day_idx, regions]
+        adjusted_values[:, _HUMIDITY] = np.clip(adjusted_values[:, _HUMIDITY] + humidity_shift, 10, 100)
+        pollution_factor = self._pollution_factor[season_idx, time_of_day_idx, regions]
+        boost = np.where((regions == _URBAN)[:, None], _URBAN_POLLUTION_BOOST, _RURAL_POLLUTION_BOOST)
+        adjusted_values[:, _POLLUTANTS] *= pollution_factor[:, None] * boost
         return adjusted_values
 
-    def _apply_physics_constraints(self, values: Dict, lat: float, lon: float, dt: datetime) -> Dict:
-        """Apply physical constraints to predictions."""
-        elevation = self._get_elevation(lat, lon)
-        elevation_factor = 1.0 - min(1.0, elevation / 5000.0)
-        temp_adjustment = elevation_factor * 2.0
-        values['BME688']['temperature'] -= temp_adjustment
-        values['MCP9808']['temperature'] -= temp_adjustment
-        values['BME688']['pressure'] *= (1 - elevation_factor * 0.00012)
-        region_type = self._determine_region_type(lat, lon)
-        area_type = 'urban' if region_type == RegionType.URBAN else 'rural'
-        calibration = self.calibration_factors[area_type]
-        values['CO2']['value'] *= calibration['CO2']
-        values['VOC']['value'] *= calibration['VOC']
-        values['PM1.0']['value'] *= calibration['PM']
-        values['PM2.5']['value'] *= calibration['PM']
-        values['PM10']['value'] *= calibration['PM']
+    def _apply_physics_constraints(self, readings: np.ndarray, regions) -> np.ndarray:
+        """
+        Apply physical constraints to predictions, in place.
+
+        Args:
+            readings: Readings ordered as _OUTPUT_FIELDS, shape (10,) or (N, 10)
+            regions: RegionType value of the location, or an array of N of them
+
+        Returns:
+            The constrained readings
+        """
+        elevation_factor = 1.0 - np.minimum(1.0, self._region_elevations[regions] / 5000.0)
+        readings[..., _TEMPERATURE_FIELDS] -= (elevation_factor * 2.0)[..., np.newaxis]
+        readings[..., _PRESSURE] *= (1 - elevation_factor * 0.00012)
+        readings *= self._calibration[regions]
+        return readings
+
+    def _calculate_enhanced_values(self, normalized_mean, adjusted_values: np.ndarray) -> np.ndarray:
+        """
+        Calculate enhanced parameter values with realistic scaling.
+
+        Args:
+            normalized_mean: Normalized model activity, a float or an array of N values
+            adjusted_values: Value vector ordered as VARIABLES, or an (N, 9) array of them
+
+        Returns:
+            Noisy sensor readings ordered as _OUTPUT_FIELDS, shape (10,) or (N, 10)
+        """
+        normalized_mean = np.asarray(normalized_mean, dtype=np.float64)[..., np.newaxis]
+        values = np.asarray(adjusted_values, dtype=np.float64)[..., _OUTPUT_SOURCE]
+        # Temperatures follow a sigmoid of the activity, gas resistance and pollutants an exponential
+        # 2r * sigmoid(k x) == r * (1 + tanh(k x / 2)): exact, and tanh cannot overflow the way exp(-k x) can
+        values[..., _TEMPERATURE_FIELDS] += _SIGMOID_RANGE * (1 + np.tanh(_SIGMOID_HALF_STEEPNESS * (normalized_mean - 0.5)))
+        values[..., _EXP_FIELDS] += _EXP_RANGE * (np.exp(3 * normalized_mean) * _INV_EXP3)
+        values[..., _HUMIDITY] = np.clip(values[..., _HUMIDITY] + normalized_mean[..., 0] * 50, 10, 100)
+        values[..., _PRESSURE] = np.clip(values[..., _PRESSURE] - normalized_mean[..., 0] * 5, 950, 1050)
+        # Unit draws scaled afterwards; uniform() with array bounds is several times slower
+        noise_scale = np.maximum(np.abs(values) * _NOISE_RELATIVE, _NOISE_MINIMUM)
+        values += self._rng.uniform(-1.0, 1.0, values.shape) * noise_scale
+        np.maximum(values[..., _PARTICULATE_FIELDS], 0, out=values[..., _PARTICULATE_FIELDS])
         return values
 
-    def _calculate_enhanced_values(self, normalized_mean: float, adjusted_values: Dict) -> Dict:
-        """Calculate enhanced parameter values with realistic scaling."""
-        def sigmoid_scale(base, factor, range_scale, steepness=1.0):
-            return base + (2 * range_scale) / (1 + math.exp(-steepness * (factor - 0.5)))
-        
-        def exp_scale(base, factor, range_scale):
-            return base + range_scale * (math.exp(3 * factor) / math.exp(3))
-        
-        def add_sensor_noise(value, relative_scale=0.01, absolute_min_noise=0.1):
-            noise_scale = max(abs(value) * relative_scale, absolute_min_noise)
-            return value + random.uniform(-noise_scale, noise_scale)
-
-        return {
-            'BME688': {
-                'temperature': add_sensor_noise(sigmoid_scale(adjusted_values['temperature'], normalized_mean, 15, 5)),
-                'humidity': add_sensor_noise(min(100, max(10, adjusted_values['humidity'] + normalized_mean * 50)), 0.005),
-                'pressure': add_sensor_noise(max(950, min(1050, adjusted_values['pressure'] - normalized_mean * 5)), 0.001),
-                'gas_resistance': add_sensor_noise(exp_scale(adjusted_values['gas_resistance'], normalized_mean, 150000), 0.02)
-            },
-            'MCP9808': {
-                'temperature': add_sensor_noise(sigmoid_scale(adjusted_values['temperature'], normalized_mean, 15, 5))
-            },
-            'CO2': {
-                'value': add_sensor_noise(exp_scale(adjusted_values['CO2'], normalized_mean, 600), 0.02, 1.0)
-            },
-            'VOC': {
-                'value': add_sensor_noise(exp_scale(adjusted_values['VOC'], normalized_mean, 400), 0.02, 0.5)
-            },
-            'PM1.0': {
-                'value': max(0, add_sensor_noise(exp_scale(adjusted_values['PM1.0'], normalized_mean, 25), 0.05, 0.1))
-            },
-            'PM2.5': {
-                'value': max(0, add_sensor_noise(exp_scale(adjusted_values['PM2.5'], normalized_mean, 30), 0.05, 0.1))
-            },
-            'PM10': {
-                'value': max(0, add_sensor_noise(exp_scale(adjusted_values['PM10'], normalized_mean, 40), 0.05, 0.1))
-            }
-        }
+    def _compute_readings(self, normalized_means: np.ndarray, regions: np.ndarray, dt: datetime) -> np.ndarray:
+        """
+        Turn model activity into constrained sensor readings for locations sharing one datetime.
+
+        Runs the temporal adjustment, enhanced scaling and physics constraints; with
+        numba they are fused into one kernel that keeps each location in a single buffer.
+
+        Args:
+            normalized_means: Array of N normalized model activities
+            regions: Array of N RegionType values
+            dt: Date and time shared by all locations
+
+        Returns:
+            Readings ordered as _OUTPUT_FIELDS, shape (N, 10)
+        """
+        if not NUMBA_AVAILABLE:
+            adjusted_values = self._apply_temporal_adjustments_batch(self._base_values[regions], dt, regions)
+            return self._apply_physics_constraints(self._calculate_enhanced_values(normalized_means, adjusted_values),
+                                                   regions)
+        temporal_features = self._datetime_to_features(dt)
+        season_idx = temporal_features['season_idx']
+        time_of_day_idx = temporal_features['time_of_day_idx']
+        readings = np.empty((len(regions), len(_OUTPUT_FIELDS)))
+        _fused_readings(normalized_means, regions, self._base_values,
+                        self._temp_shift[season_idx, time_of_day_idx], 1 + 0.1 * temporal_features['seasonal_sin'],
+                        self._humidity_shift[season_idx, time_of_day_idx],
+                        self._pollution_factor[season_idx, time_of_day_idx],
+                        self._region_elevations, self._calibration, readings)
+        return readings
 
     def predict(self, date_str: str, lat: float, lon: float, time_str: str = None) -> Dict:
         """
@@ -750,29 +1409,90 @@ class HighAccuracyEnvironmentalPredictor:
         Returns:
             Dictionary containing predicted environmental parameters and metadata
         """
+        # Bad input is rejected before any model work, and errors from the model
+        # and tables are no longer reported as bad input
+        try:
+            dt = _parse_datetime(date_str, time_str)
+            float(lat), float(lon)
+        except (TypeError, ValueError) as e:
+            return {'error': str(e), 'message': 'Invalid date/time format or input values'}
         try:
-            dt = datetime.strptime(f"{date_str} {time_str if time_str else '00:00'}", "%Y%m%d %H:%M")
             input_patch = self._generate_synthetic_patch(lat, lon, dt)
-            pred = self.model.predict(input_patch[np.newaxis, ...], verbose=0)[0]
-            mean_pred = pred[..., 0]
-            uncertainty = pred[..., 1]
-            pred_mean = np.mean(mean_pred)
-            pred_range = np.max(mean_pred) - np.min(mean_pred)
-            normalized_mean = (pred_mean - np.min(mean_pred)) / (pred_range + 1e-7)
+            activity, uncertainty = self._summarize_predictions(self._run_model(input_patch[np.newaxis, ...]))
             region_type = self._determine_region_type(lat, lon)
-            base_values = self.regional_base_values[region_type]
-            adjusted_values = self._apply_temporal_adjustments(base_values, dt, region_type)
-            results = self._calculate_enhanced_values(normalized_mean, adjusted_values)
-            results = self._apply_physics_constraints(results, lat, lon, dt)
+            readings = self._compute_readings(activity, np.array([region_type], dtype=np.intp), dt)
+        except Exception as e:
+            return {'error': str(e), 'message': 'Prediction failed'}
+        results = _readings_to_dict(readings[0])
+        temporal_features = self._datetime_to_features(dt)
+        results['metadata'] = {
+            'latitude': lat,
+            'longitude': lon,
+            'date': date_str,
+            'time': time_str if time_str else '00:00',
+            'season': temporal_features['season'],
+            'time_of_day': temporal_features['time_of_day'],
+            'normalized_activity': float(activity[0]),
+            'uncertainty': float(uncertainty[0])
+        }
+        return results
+
+    def predict_batch(self, date_str, lats: np.ndarray, lons: np.ndarray, time_str=None) -> Dict:
+        """
+        Make environmental predictions for many locations with batched model calls.
+
+        Args:
+            date_str: Date string in YYYYMMDD format, or a sequence with one per location
+            lats: Array of latitudes in degrees
+            lons: Array of longitudes in degrees
+            time_str: Time string in HH:MM format (optional), or a sequence with one per location
+
+        Returns:
+            Dictionary with the same layout as predict(), where every value is an array
+            holding one entry per location. The date, time, season and time_of_day
+            metadata are single values when one date and time was given for all locations.
+        """
+        try:
+            lats = np.asarray(lats, dtype=np.float64)
+            lons = np.asarray(lons, dtype=np.float64)
+            if lats.shape != lons.shape or lats.ndim != 1:
+                raise ValueError("lats and lons must be 1-D arrays of the same length")
+            dates = np.broadcast_to(np.asarray(date_str, dtype=object), lats.shape).tolist()
+            times = [t if t else '00:00' for t in np.broadcast_to(np.asarray(time_str, dtype=object), lats.shape).tolist()]
+
+            # Locations sharing a date and time share the temporal features, so the
+            # patch and adjustment helpers run once per distinct datetime
+            groups = {}
+            for i, key in enumerate(zip(dates, times)):
+                groups.setdefault(key, []).append(i)
+            datetimes = [_parse_datetime(date, time) for date, time in groups]
+            group_ids = np.empty(len(lats), dtype=np.intp)
+            for group_id, rows in enumerate(groups.values()):
+                group_ids[rows] = group_id
+
+            normalized_means, uncertainty = self._batch_activity(lats, lons, datetimes, group_ids)
+            regions = self._region_values(lats, lons)
+            readings = np.empty((len(lats), len(_OUTPUT_FIELDS)))
+            seasons = np.empty(len(lats), dtype=object)
+            times_of_day = np.empty(len(lats), dtype=object)
+            for dt, rows in zip(datetimes, groups.values()):
+                rows = np.asarray(rows)
+                readings[rows] = self._compute_readings(normalized_means[rows], regions[rows], dt)
+                temporal_features = self._datetime_to_features(dt)
+                seasons[rows] = temporal_features['season']
+                times_of_day[rows] = temporal_features['time_of_day']
+            results = _readings_to_dict(readings)
+
+            shared_datetime = np.ndim(date_str) == 0 and np.ndim(time_str) == 0
             results['metadata'] = {
-                'latitude': lat,
-                'longitude': lon,
-                'date': date_str,
-                'time': time_str if time_str else '00:00',
-                'season': self._datetime_to_features(dt)['season'],
-                'time_of_day': self._datetime_to_features(dt)['time_of_day'],
-                'normalized_activity': float(normalized_mean),
-                'uncertainty': float(np.mean(uncertainty))
+                'latitude': lats,
+                'longitude': lons,
+                'date': date_str if shared_datetime else np.array(dates),
+                'time': (time_str if time_str else '00:00') if shared_datetime else np.array(times),
+                'season': seasons[0] if shared_datetime and len(lats) else seasons,
+                'time_of_day': times_of_day[0] if shared_datetime and len(lats) else times_of_day,
+                'normalized_activity': normalized_means,
+                'uncertainty': uncertainty
             }
             return results
         except ValueError as e:
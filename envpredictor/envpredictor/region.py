@@ -1,13 +1,13 @@
-from enum import Enum
+from enum import IntEnum
 
-class RegionType(Enum):
-    OCEAN = 1
-    COASTAL = 2
-    FOREST_TROPICAL = 3
-    FOREST_TEMPERATE = 4
-    GRASSLAND = 5
-    DESERT = 6
-    TUNDRA = 7
-    URBAN = 8
-    MOUNTAIN = 9
-    AGRICULTURAL = 10
\ No newline at end of file
+class RegionType(IntEnum):
+    OCEAN = 0
+    COASTAL = 1
+    FOREST_TROPICAL = 2
+    FOREST_TEMPERATE = 3
+    GRASSLAND = 4
+    DESERT = 5
+    TUNDRA = 6
+    URBAN = 7
+    MOUNTAIN = 8
+    AGRICULTURAL = 9
\ No newline at end of file
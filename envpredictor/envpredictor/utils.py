@@ -1,9 +1,36 @@
-import hashlib
+import zlib
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the jitted helpers then run as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _splitmix64(x: int) -> int:
+    """Mix a 64-bit integer with one splitmix64 step."""
+    z = (x + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+def _datetime_seconds(dt) -> int:
+    """Whole seconds since 0001-01-01, independent of timezone and platform."""
+    return dt.toordinal() * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
 
 def generate_deterministic_variation(lat: float, lon: float, dt, param: str, scale: float) -> float:
     """Generate a small deterministic variation based on input parameters."""
-    input_str = f"{lat:.6f}_{lon:.6f}_{dt.strftime('%Y%m%d%H%M%S')}_{param}"
-    hash_obj = hashlib.sha256(input_str.encode())
-    hash_value = int(hash_obj.hexdigest(), 16)
-    normalized = (hash_value % 10000) / 10000.0 * 2 - 1
-    return normalized * scale
\ No newline at end of file
+    key = (round(lat * 1e6) * 0x9E3779B97F4A7C15
+           ^ round(lon * 1e6) * 0xC2B2AE3D27D4EB4F
+           ^ _datetime_seconds(dt) * 0x165667B19E3779F9
+           ^ zlib.crc32(param.encode()))
+    h = _splitmix64(key & _MASK64)
+    normalized = (h & 0xFFFF) / 65535.0 * 2 - 1
+    return normalized * scale
@@ -12,6 +12,10 @@ setup(
         'numpy>=1.23.0',
         'python-dateutil>=2.8.2'
     ],
+    extras_require={
+        # JIT-compiles the numeric helpers; they fall back to plain Python without it
+        'numba': ['numba>=0.56']
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -1,6 +1,11 @@
 import pytest
 from envpredictor import HighAccuracyEnvironmentalPredictor
+import envpredictor.predictor as predictor_module
+from envpredictor.predictor import _parse_datetime
+from datetime import datetime
 import os
+import threading
+import numpy as np
 
 def test_predictor_initialization():
     model_path = "path/to/dummy/model.keras"  # Replace with actual path for testing
@@ -18,4 +23,159 @@ def test_predict():
     assert isinstance(result, dict)
     if 'error' not in result:
         assert 'BME688' in result
-        assert 'metadata' in result
\ No newline at end of file
+        assert 'metadata' in result
+
+if predictor_module.NUMBA_AVAILABLE:
+    from numba import njit
+
+    @njit
+    def _seed_numba_noise(seed):
+        np.random.seed(seed)
+
+def _reseed_noise(predictor, seed=0):
+    """Restart the sensor noise of both the NumPy and the numba path from seed."""
+    predictor._rng = np.random.default_rng(seed)
+    if predictor_module.NUMBA_AVAILABLE:
+        _seed_numba_noise(seed)
+
+def _stub_model(inputs):
+    """Deterministic stand-in for the network: returns two frames of each input patch."""
+    return np.concatenate([inputs[:, 2], inputs[:, 0]], axis=-1)
+
+@pytest.fixture(params=['numba', 'numpy'])
+def stub_predictor(request, monkeypatch):
+    """Predictor with the network stubbed, so no model or TensorFlow is needed."""
+    if request.param == 'numba' and not predictor_module.NUMBA_AVAILABLE:
+        pytest.skip("numba not installed")
+    if request.param == 'numpy':
+        monkeypatch.setattr(predictor_module, 'NUMBA_AVAILABLE', False)
+    predictor = HighAccuracyEnvironmentalPredictor.__new__(HighAccuracyEnvironmentalPredictor)
+    predictor._build_tables()
+    predictor._thread_local = threading.local()
+    predictor._tflite_model = None
+    predictor._run_model = _stub_model
+    _reseed_noise(predictor)
+    return predictor
+
+def _assert_batch_matches_predict(predictor, dates, lats, lons, times):
+    """Check every predict_batch entry against predict() for the same location."""
+    _reseed_noise(predictor)
+    batch = predictor.predict_batch(dates, lats, lons, times)
+    assert 'error' not in batch
+    dates = np.broadcast_to(np.asarray(dates, dtype=object), lats.shape)
+    times = np.broadcast_to(np.asarray(times, dtype=object), lats.shape)
+
+    # predict_batch draws the noise group by group, in order of first appearance
+    first_seen = {}
+    for i, key in enumerate(zip(dates, times)):
+        first_seen.setdefault(key, i)
+    order = sorted(range(len(lats)), key=lambda i: first_seen[dates[i], times[i]])
+
+    _reseed_noise(predictor)
+    for i in order:
+        single = predictor.predict(dates[i], lats[i], lons[i], times[i])
+        assert 'error' not in single
+        for sensor, fields in single.items():
+            if sensor == 'metadata':
+                continue
+            for field, value in fields.items():
+                assert batch[sensor][field].shape == lats.shape
+                np.testing.assert_allclose(batch[sensor][field][i], value, rtol=1e-9)
+        for field in ('normalized_activity', 'uncertainty'):
+            np.testing.assert_allclose(batch['metadata'][field][i], single['metadata'][field], rtol=1e-5)
+    return batch
+
+def test_predict_batch(stub_predictor):
+    # Ocean, urban (New York), desert, mountain and tropical locations
+    lats = np.array([0.0, 40.7, 23.0, 30.0, 11.0])
+    lons = np.array([-150.0, -74.0, 10.0, 80.0, 77.0])
+    batch = _assert_batch_matches_predict(stub_predictor, "20251212", lats, lons, "08:00")
+    assert batch['PM2.5']['value'].shape == (5,)
+    assert batch['BME688']['temperature'].shape == (5,)
+    assert batch['metadata']['date'] == "20251212"
+    assert batch['metadata']['season'] == 'winter'
+    assert batch['metadata']['time_of_day'] == 'morning'
+
+def test_predict_batch_empty(stub_predictor):
+    batch = stub_predictor.predict_batch("20251212", np.array([]), np.array([]), "08:00")
+    assert 'error' not in batch
+    assert batch['CO2']['value'].shape == (0,)
+
+def test_predict_batch_rejects_mismatched_coordinates(stub_predictor):
+    batch = stub_predictor.predict_batch("20251212", np.array([11.0, 12.0]), np.array([77.0]), "08:00")
+    assert batch['message'] == 'Invalid date/time format or input values'
+
+def test_predict_batch_nan_model_output(stub_predictor):
+    def nan_model(inputs):
+        preds = _stub_model(inputs)
+        preds[1, ..., 0] = np.nan
+        return preds
+
+    stub_predictor._run_model = nan_model
+    lats = np.array([11.0, 11.05, 10.95])
+    lons = np.array([77.0, 77.05, 76.95])
+    batch = stub_predictor.predict_batch("20251212", lats, lons, "08:00")
+    assert 'error' not in batch
+    assert np.isnan(batch['metadata']['normalized_activity'][1])
+    assert np.isnan(batch['CO2']['value'][1])
+    assert np.isnan(batch['VOC']['value'][1])
+    assert np.isnan(batch['PM2.5']['value'][1])
+    for sensor in ('CO2', 'VOC', 'PM2.5'):
+        assert np.all(np.isfinite(batch[sensor]['value'][[0, 2]]))
+
+def test_predict_batch_per_location_datetimes(stub_predictor):
+    calls = []
+
+    def counting_model(inputs):
+        calls.append(len(inputs))
+        return _stub_model(inputs)
+
+    stub_predictor._run_model = counting_model
+    n = predictor_module._MAX_MODEL_BATCH + 44
+    rng = np.random.default_rng(1)
+    lats = rng.uniform(-60.0, 70.0, n)
+    lons = rng.uniform(-180.0, 180.0, n)
+    dates = np.array(["20250115", "20250715", "20251020"])[np.arange(n) % 3]
+    times = np.array(["08:00", "14:30", "", "23:15"])[np.arange(n) % 4]
+    batch = _assert_batch_matches_predict(stub_predictor, dates, lats, lons, times)
+
+    # The batch runs in _MAX_MODEL_BATCH chunks, followed by one call per predict()
+    assert calls == [predictor_module._MAX_MODEL_BATCH, 44] + [1] * n
+    assert batch['CO2']['value'].shape == (n,)
+    assert list(batch['metadata']['season'][:3]) == ['winter', 'summer', 'fall']
+    assert list(batch['metadata']['time'][:4]) == ['08:00', '14:30', '00:00', '23:15']
+    assert list(batch['metadata']['time_of_day'][:4]) == ['morning', 'afternoon', 'night', 'night']
+
+def test_merra_cells_match_scalar_index(stub_predictor):
+    # Includes points beyond the grid and on its edges, which are clamped
+    lats = np.array([11.0, 40.7, -90.0, 90.0, -95.0, 0.25, 89.999])
+    lons = np.array([77.0, -74.0, -180.0, 179.375, 200.0, 0.3125, -0.001])
+    lat_idx, lon_idx = stub_predictor.merra_cells(lats, lons)
+    assert list(zip(lat_idx.tolist(), lon_idx.tolist())) == [
+        stub_predictor._latlon_to_merra_index(lat, lon) for lat, lon in zip(lats, lons)
+    ]
+
+def test_parse_datetime_accepts_date_and_time():
+    assert _parse_datetime("20251212", "08:30") == datetime(2025, 12, 12, 8, 30)
+    assert _parse_datetime("20251212", "8:5") == datetime(2025, 12, 12, 8, 5)
+
+def test_parse_datetime_defaults_to_midnight():
+    assert _parse_datetime("20251212") == datetime(2025, 12, 12)
+    assert _parse_datetime("20251212", None) == datetime(2025, 12, 12)
+    assert _parse_datetime("20251212", "") == datetime(2025, 12, 12)
+
+@pytest.mark.parametrize("date_str, time_str", [
+    ("2025121", "08:00"),    # too short
+    ("202512120", "08:00"),  # too long
+    ("2025-1-1", "08:00"),
+    ("20251312", "08:00"),   # month out of range
+    ("20250229", "08:00"),   # not a leap year
+    ("20251212", "0800"),
+    ("20251212", "24:00"),
+    ("20251212", "08:60"),
+    ("20251212", " 8:00"),
+    ("20251212", "08:000"),
+])
+def test_parse_datetime_rejects_bad_input(date_str, time_str):
+    with pytest.raises(ValueError):
+        _parse_datetime(date_str, time_str)